@@ -93,7 +93,7 @@ def _automated_differentiation(expr, varnames, domain, point):
     Method to compute automatic differentiation of a sympy expression
     """
     if expr == 0:
-        return NualNumber([0 for _ in range(len(varnames) + 1)])
+        return NualNumber([0] * (len(varnames) + 1))
 
     if isinstance(expr, (SparsePolynomial, RationalFunction)):
         return expr.automated_diff(
@@ -101,16 +101,13 @@ def _automated_differentiation(expr, varnames, domain, point):
         )
     else:
         func = _func_for_expr(expr, tuple(varnames), domain)
-        to_eval = [
-            NualNumber(
-                [domain.convert(point[i])]
-                + [
-                    domain.convert(1) if j == i else domain.convert(0)
-                    for j in range(len(point))
-                ]
-            )
-            for i in range(len(point))
-        ]
+        ## the i-th variable is the n-ual number (point[i], e_i): 0 and 1 are converted only once
+        one, zero = domain.one, domain.zero
+        to_eval = []
+        for i in range(len(point)):
+            coeffs = [zero] * (len(point) + 1)
+            coeffs[0], coeffs[i + 1] = domain.convert(point[i]), one
+            to_eval.append(NualNumber(coeffs))
         return func(*to_eval)
 
 
@@ -612,9 +609,12 @@ class FODESystem:
         self.normalize()
         variables = self.variables
         if isinstance(self.equations[0], (SparsePolynomial, RationalFunction)):
+            var_to_ind = {v: i for i, v in enumerate(variables)}
             return tuple(
                 [
-                    SparsePolynomial.var_from_string(v, variables, self.field)
+                    SparsePolynomial.var_from_string(
+                        v, variables, self.field, var_to_ind
+                    )
                     for v in variables
                 ]
             )
@@ -947,8 +947,8 @@ class FODESystem:
             else other.eval_equation(other.equations, x)
         )
         if how in ("symbolic", "exact"):
-            Lx = [sum(row[i] * x[i] for i in row.nonzero) for row in x2y]
-            Lfx = [sum(row[i] * fx[i] for i in row.nonzero) for row in x2y]
+            Lx = [sum(c * x[i] for i, c in row.items()) for row in x2y]
+            Lfx = [sum(c * fx[i] for i, c in row.items()) for row in x2y]
         else:
             Lx = matmul(x2y, x)
             Lfx = matmul(x2y, fx)
@@ -1359,11 +1359,17 @@ class FODESystem:
                         )
                     entry = field.convert(coef) * exp
                     if m_der not in jacobians:
-                        jacobians[m_der] = SparseRowMatrix(len(variables), field)
-                    jacobians[m_der].increment(var, p_ind, entry)
-
-        result = jacobians.values()
-        return list(result)
+                        jacobians[m_der] = ([], [], [])
+                    rows, columns, values = jacobians[m_der]
+                    rows.append(var)
+                    columns.append(p_ind)
+                    values.append(entry)
+
+        # building each matrix at once from its list of entries
+        return [
+            SparseRowMatrix.from_coo(len(variables), *coo, field, convert=False)
+            for coo in jacobians.values()
+        ]
 
     def _construct_matrices_from_rational_functions(self):
         """
@@ -1383,8 +1389,12 @@ class FODESystem:
         variables = self.variables
         field = self.field
 
-        # Compute Jacobian
-        J = [[rf.derivative(v) for rf in rational_functions] for v in variables]
+        # Compute Jacobian (all the derivatives of each function at once)
+        derivatives = [rf.jacobian(variables) for rf in rational_functions]
+        J = [
+            [rf_derivatives[i] for rf_derivatives in derivatives]
+            for i in range(len(variables))
+        ]
 
         def lcm_rec(arr, l, u):
             if u - l == 1:
@@ -1394,11 +1404,7 @@ class FODESystem:
             return res
 
         denoms = [rf.denom for rf in rational_functions]
-        d = list(
-            filter(
-                (lambda x: x != SparsePolynomial.from_const(1, [], self.field)), denoms
-            )
-        )
+        d = [denom for denom in denoms if not denom.is_unitary()]
         lcm = lcm_rec(d, 0, len(d))
         lcm = lcm * lcm
 
@@ -1438,8 +1444,12 @@ class FODESystem:
         variables = self.variables
         field = self.field
 
-        # Compute Jacobian
-        J = [[rf.derivative(v) for rf in rational_functions] for v in variables]
+        # Compute Jacobian (all the derivatives of each function at once)
+        derivatives = [rf.jacobian(variables) for rf in rational_functions]
+        J = [
+            [rf_derivatives[i] for rf_derivatives in derivatives]
+            for i in range(len(variables))
+        ]
 
         # we create the matrices by evaluating the jacobian
         subspace = self.matrices_subspace_class(field, **self.matrices_subspace_kwds)
@@ -3181,7 +3191,7 @@ class FODESystem:
         ## Computing the new variables and their expression in term of old variables
         vars_new = [f"{new_vars_name}{i}" for i in range(lumping_subspace.dim())]
         map_old_variables = [
-            SparsePolynomial(vars_old, field, {((j, 1),): v[j] for j in v.nonzero})
+            SparsePolynomial(vars_old, field, {((j, 1),): c for j, c in v.items()})
             for v in lumping_subspace.basis()
         ]
 
@@ -284,8 +284,9 @@ class SparseVector():
             return self
 
         new_vector = SparseVector(self.dim, new_field)
-        for i in self.nonzero:
-            new_vector[i] = new_field.convert(self[i])
+        convert = new_field.convert
+        for i, value in self.__data.items():
+            new_vector[i] = convert(value)
         return new_vector
 
     def as_matrix(self, nrows: int):
@@ -332,16 +333,30 @@ class SparseVector():
 
         ncols = self.dim // nrows
         output = SparseRowMatrix((nrows, ncols), self.field)
-        for index in self.nonzero:
-            row = index // ncols
-            col = index % ncols
-            output.increment(row, col, self.__data[index])
+        increment = output.increment
+        for index, value in self.__data.items():
+            row, col = divmod(index, ncols)
+            increment(row, col, value)
 
         return output
 
     def get_data(self):
         return self.__data
 
+    def items(self):
+        r"""
+        Iterates over the pairs ``(index, value)`` of the non-zero entries of the vector.
+
+        Examples::
+
+            >>> from clue.clue import SparseVector
+            >>> from sympy import QQ
+            >>> v = SparseVector.from_list([0,3,0,5], QQ)
+            >>> sorted(v.items())
+            [(1, MPQ(3,1)), (3, MPQ(5,1))]
+        """
+        return self.__data.items()
+
     # --------------------------------------------------------------------------
 
     def inner_product(self, rhs: SparseVector):
@@ -525,6 +540,27 @@ class SparseVector():
                 result[i] = to_insert  # __setitem__ updates the nonzero attribute
         return result
 
+    @classmethod
+    def from_dict(cls, dim: int, data: dict[int, Any], field: Domain = QQ):
+        r"""
+        Method to build a new :class:`SparseVector` from a dictionary `i \rightarrow v[i]`.
+
+        The entries of ``data`` must be non-zero elements of ``field`` in the range of ``dim``:
+        they are not converted nor checked, and ``data`` is used (not copied) by the new vector.
+
+        Examples::
+
+            >>> from clue.linalg import SparseVector
+            >>> from sympy import QQ
+            >>> v = SparseVector.from_dict(4, {1: QQ(2), 3: QQ(-1,2)}, QQ)
+            >>> v == SparseVector.from_list([0, 2, 0, QQ(-1,2)], QQ), v.nonzero
+            (True, {1, 3})
+        """
+        result = cls(dim, field)
+        result.__data = data
+        result.nonzero = set(data)
+        return result
+
     # --------------------------------------------------------------------------
 
     def rational_reconstruction(self):
@@ -968,10 +1004,10 @@ class SparseRowMatrix():
                 [MPQ(1,2), MPQ(1,2), MPQ(3,4), MPQ(4,5)]
         """
         result = SparseVector(self.nrows * self.ncols, self.field)
-        for i in self.nonzero:
-            ith_row = self.row(i)
-            for j in ith_row.nonzero:
-                result[self.ncols * i + j] = ith_row[j]
+        ncols = self.ncols
+        for i, ith_row in self.__data.items():
+            for j, value in ith_row.items():
+                result[ncols * i + j] = value
         return result
 
     def to_list(self):
@@ -990,12 +1026,60 @@ class SparseRowMatrix():
         columns = []
         values = []
         for row, vector in self.__data.items():
-            for column,value in vector.get_data().items():
+            for column,value in vector.items():
                 rows.append(row)
                 columns.append(column)
                 values.append(value)
         return rows,columns,values
 
+    @classmethod
+    def from_coo(
+        cls,
+        dim: int | list[int] | tuple[int, int],
+        rows: list[int],
+        columns: list[int],
+        values: list[Any],
+        field: Domain = QQ,
+        convert: bool = True,
+    ):
+        r"""
+        Method to build a :class:`SparseRowMatrix` from the COOrdinate list format.
+
+        This method is the inverse of :func:`to_coo`. Repeated cells are added together and
+        the rows are built at once, avoiding the checks of :func:`increment` for each entry.
+        If ``convert`` is ``False``, the values must already be elements of ``field``.
+
+        Examples::
+
+            >>> from clue.clue import SparseRowMatrix
+            >>> from sympy import QQ
+            >>> M = SparseRowMatrix.from_coo(2, [0, 1, 0, 1], [0, 1, 1, 1], [1, 2, 3, -2], QQ)
+            >>> print(M.pretty_print())
+            [ 1 3 ]
+            [ 0 0 ]
+            >>> M.nonzero
+            {0}
+            >>> N = SparseRowMatrix.from_list([[1,2],[0,4]], QQ)
+            >>> SparseRowMatrix.from_coo(N.dim, *N.to_coo(), QQ) == N
+            True
+        """
+        entries: dict[int, dict[int, Any]] = dict()
+        for i, j, value in zip(rows, columns, values):
+            row = entries.setdefault(i, dict())
+            row[j] = row.get(j, field.zero) + (field.convert(value) if convert else value)
+
+        result = cls(dim, field)
+        for i, row in entries.items():
+            if i < 0 or i >= result.nrows:
+                raise IndexError(f"Row {i} out of dimension")
+            data = {j: value for j, value in row.items() if value}
+            if any(j < 0 or j >= result.ncols for j in data):
+                raise IndexError(f"Column out of dimension in row {i}")
+            if data:
+                result.__data[i] = SparseVector.from_dict(result.ncols, data, field)
+                result.nonzero.add(i)
+        return result
+
     def pretty_print(self):
         r"""Method to generate a pretty printing of the Sparse matrix"""
         entries = [[str(el) for el in row] for row in self.to_list()]
@@ -1384,13 +1468,13 @@ class Subspace(object):
             new_rhs = [0 for _ in range(self.dim())]
         for i, vec in enumerate(basis):
             logger.log(5, f"[perform_change_of_variables]    Equation number {i}")
-            for j in vec.nonzero:
+            for j, coeff in vec.items():
                 # ordering is important due to the implementation of
                 # multiplication for SparsePolynomial
-                if not isinstance(vec[j], FracElement):
-                    new_rhs[i] += rhs[j] * vec[j]
+                if not isinstance(coeff, FracElement):
+                    new_rhs[i] += rhs[j] * coeff
                 else:
-                    new_rhs[i] += rhs[j] * vec[j].as_expr()
+                    new_rhs[i] += rhs[j] * coeff.as_expr()
 
         logger.debug(
             "[perform_change_of_variables] Plugging zero to nonpivot coordinates"
@@ -1700,9 +1784,10 @@ class OrthogonalSubspace(Subspace):
         L = self.matrix()
         psi_L = self.pinv()
         logger.debug("[perform_change_of_variables] Constructing new rhs")
+        var_to_ind = {v: i for i, v in enumerate(old_vars)}
         x = (
             [
-                SparsePolynomial.var_from_string(var, old_vars, self.field)
+                SparsePolynomial.var_from_string(var, old_vars, self.field, var_to_ind)
                 for var in old_vars
             ]
             if isinstance(rhs[0], (SparsePolynomial, RationalFunction))
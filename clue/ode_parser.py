@@ -350,7 +350,7 @@ def parse_reactions(lines, varnames, parser="sympy", domain=QQ):
             monomial = SparsePolynomial(
                 varnames,
                 domain,
-                {tuple((var_dict[v], mult) for v, mult in ldict.items()): domain(1)},
+                {tuple(sorted((var_dict[v], mult) for v, mult in ldict.items())): domain(1)},
             )
         else:
             raise NotImplementedError(f"Parser {parser} not implemented")
@@ -38,9 +38,10 @@ r"""
         ODEBase 1399 (BIOMD0000000098) [FODESystem -- 17 -- Mul]
 """
 
-import io, logging, re, requests
-from bs4 import BeautifulSoup
+import io, logging, re, time
 from clue import FODESystem, SparsePolynomial
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from sympy import QQ
 from sympy.parsing.sympy_parser import (
     auto_number,
@@ -54,8 +55,108 @@ from sympy.parsing.sympy_parser import (
 logger = logging.getLogger(__name__)
 
 
+## Number of pages requested at once to ODEBase (see get_clue and prefetch_models)
+__MAX_WORKERS = 4
+
+
+@lru_cache(maxsize=1)
+def __session():
+    ## Shared session so the connection to ODEBase is reused among requests. The connection
+    ## pool of the adapter is thread-safe and keeps one connection for each concurrent request.
+    ## ``requests`` is imported here to keep the import of ``clue`` light.
+    import requests
+
+    session = requests.Session()
+    session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=__MAX_WORKERS))
+    session.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=__MAX_WORKERS))
+    return session
+
+
+def __download(url: str) -> bytes:
+    ## Responses with an error status raise an exception, so they are never cached
+    response = __session().get(url)
+    response.raise_for_status()
+    return response.content
+
+
+## Number of models downloaded at once by ode_scrapper (4 pages each, so they fit in the cache)
+__PREFETCH_BLOCK = 32
+
+
+@lru_cache(maxsize=256)
+def __cached_content(url: str) -> bytes:
+    return __download(url)
+
+
+def get_content(url: str, use_cache: bool = True) -> bytes:
+    r"""
+    Content of a GET request to ``url``.
+
+    ODEBase pages are static, so the same page is requested several times when
+    building a model (or when retrying to read it). If ``use_cache`` is ``True``,
+    the contents are kept in memory and repeated requests are served without
+    connecting again to the website.
+
+    If ODEBase answers with an error status (e.g., 404 or 429), a ``requests.HTTPError``
+    is raised and nothing is stored in the cache, so the page is requested again next time.
+    """
+    if use_cache:
+        return __cached_content(url)
+    return __download(url)
+
+
+def get_soup(url: str, use_cache: bool = True):
+    r"""HTML parsing (with BeautifulSoup) of the content of ``url`` (see :func:`get_content`)"""
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(io.BytesIO(get_content(url, use_cache)), "html.parser")
+
+
+def model_urls(base_url: str, ref: str | int) -> tuple[str, ...]:
+    r"""URLs of all the pages needed to build the model ``ref`` (see :func:`get_clue`)"""
+    return (
+        f"{base_url}/detail/species_map/{ref}/text",
+        f"{base_url}/detail/parameter_map/{ref}/text",
+        f"{base_url}/detail/odes/{ref}/sage",
+        f"{base_url}/detail/parameters/{ref}/sage",
+    )
+
+
+def prefetch_models(
+    base_url: str,
+    refs: list[str | int],
+    max_workers: int = __MAX_WORKERS,
+    max_retries: int = 3,
+):
+    r"""
+    Downloads concurrently all the pages of the models in ``refs`` into the cache of :func:`get_content`.
+
+    At most ``max_workers`` requests are sent at the same time to ODEBase. When the website
+    asks to slow down (status 429), the request waits (as long as the header ``Retry-After``
+    says, or ``2**attempt`` seconds) and is repeated up to ``max_retries`` times. Other failed
+    requests are ignored here: errors are not cached (see :func:`get_content`), so they will be
+    repeated (and reported) when the model is actually built.
+    """
+    def fetch(url):
+        for attempt in range(max_retries + 1):
+            try:
+                get_content(url)
+                return
+            except Exception as e:
+                response = getattr(e, "response", None)
+                if response is None or response.status_code != 429 or attempt == max_retries:
+                    logger.debug(f"[prefetch] Error while getting {url}: {e}")
+                    return
+                delay = response.headers.get("Retry-After", "")
+                time.sleep(int(delay) if delay.isdigit() else 2**attempt)
+
+    urls = [url for ref in refs for url in model_urls(base_url, ref)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(fetch, urls))
+
+
 def get_dictionary_of_variables(
-    base_url: str, what: str, ref: str | int
+    base_url: str, what: str, ref: str | int, use_cache: bool = True
 ) -> dict[str, str]:
     if what in ("variables", "species", "var"):
         what = "species_map"
@@ -66,8 +167,7 @@ def get_dictionary_of_variables(
             "The argument 'what' must indicate either 'variables' or 'parameters'"
         )
 
-    response = requests.get(f"{base_url}/detail/{what}/{ref}/text")
-    soup = BeautifulSoup(io.BytesIO(response.content), "html.parser")
+    soup = get_soup(f"{base_url}/detail/{what}/{ref}/text", use_cache)
     output = dict()
     for line in soup.get_text().split("\n"):
         if "=" in line:
@@ -77,13 +177,24 @@ def get_dictionary_of_variables(
     return output
 
 
-def get_odes(base_url: str, ref: str | int) -> dict[str, str]:
-    response = requests.get(f"{base_url}/detail/odes/{ref}/sage")
-    soup = BeautifulSoup(io.BytesIO(response.content), "html.parser")
+def get_odes(
+    base_url: str,
+    ref: str | int,
+    use_cache: bool = True,
+    variables: dict[str, str] = None,
+) -> dict[str, str]:
+    r"""
+    Equations of the model ``ref`` for each species.
+
+    The species are given by ``variables`` (see :func:`get_dictionary_of_variables`). If it
+    is not given, the species map of the model is downloaded.
+    """
+    soup = get_soup(f"{base_url}/detail/odes/{ref}/sage", use_cache)
 
     import re
 
-    variables = get_dictionary_of_variables(base_url, "var", ref)
+    if variables is None:
+        variables = get_dictionary_of_variables(base_url, "var", ref, use_cache)
     equations = {v: "0" for v in variables}
 
     for line in soup.get_text().split("\n"):
@@ -101,9 +212,10 @@ def get_odes(base_url: str, ref: str | int) -> dict[str, str]:
     return equations
 
 
-def get_parameter_values(base_url: str, ref: str | int) -> dict[str, str]:
-    response = requests.get(f"{base_url}/detail/parameters/{ref}/sage")
-    soup = BeautifulSoup(io.BytesIO(response.content), "html.parser")
+def get_parameter_values(
+    base_url: str, ref: str | int, use_cache: bool = True
+) -> dict[str, str]:
+    soup = get_soup(f"{base_url}/detail/parameters/{ref}/sage", use_cache)
     output = dict()
     for line in soup.get_text().split("\n"):
         if "=" in line:
@@ -179,11 +291,23 @@ def get_clue(
     transform_names: bool = True,
     polynomial: str = False,
     field=QQ,
+    use_cache: bool = True,
 ) -> FODESystem:
-    variables = get_dictionary_of_variables(base_url, "var", ref)
-    equations = get_odes(base_url, ref)
-    parameters = get_dictionary_of_variables(base_url, "par", ref)
-    parameter_values = get_parameter_values(base_url, ref)
+    ## The pages of the model are independent: we request them concurrently. The ODEs need
+    ## the species, so both are read by the same worker and the species map is downloaded once
+    def species_and_odes():
+        variables = get_dictionary_of_variables(base_url, "var", ref, use_cache)
+        return variables, get_odes(base_url, ref, use_cache, variables)
+
+    with ThreadPoolExecutor(max_workers=__MAX_WORKERS) as executor:
+        futures = (
+            executor.submit(species_and_odes),
+            executor.submit(
+                get_dictionary_of_variables, base_url, "par", ref, use_cache
+            ),
+            executor.submit(get_parameter_values, base_url, ref, use_cache),
+        )
+    (variables, equations), parameters, parameter_values = (f.result() for f in futures)
 
     ## We transform the values into the given field
     parameter_values = {k: field(v) for (k, v) in parameter_values.items()}
@@ -234,6 +358,7 @@ def ode_scrapper(
     name: str = None,
     index: int = None,
     translation: bool = False,
+    use_cache: bool = True,
 ) -> FODESystem | list[FODESystem]:
     r"""
     Method to create the :class:`FODESystem` from an entry in the ODEBase Database.
@@ -260,6 +385,9 @@ def ode_scrapper(
     * ``translation``: models in ODEBase are usually defined with predefined names that are then
       map to the real values of their corresponding meaning. This flag indicates if the obtained
       model must translate the names to the true names or not.
+    * ``use_cache``: the pages downloaded from ODEBase are kept in memory, so repeated calls
+      (or the fallbacks used when a model can not be parsed) do not download them again. Setting
+      this flag to ``False`` forces all the requests to be sent to the website.
     """
     # URL of the website to analyze
     base_url = "https://www.odebase.org"
@@ -291,12 +419,9 @@ def ode_scrapper(
     deficiency_url = f"deficiency_range={deficiency}" if deficiency != None else ""
     url = f"{base_url}/table/?{'&'.join(el for el in [rational_url, polynomial_url, num_species_url, num_parameters_url, num_constraints_url, deficiency_url] if el != '')}"
 
-    # Send an HTTP GET request to the website
+    # Send an HTTP GET request to the website and parse the HTML code
     logger.debug("[scrap] Getting the list of Rational models...")
-    response = requests.get(url)
-
-    # Parse the HTML code using BeautifulSoup
-    soup = BeautifulSoup(io.BytesIO(response.content), "html.parser")
+    soup = get_soup(url, use_cache)
 
     # Extract the relevant information from the HTML code
     references = list()
@@ -327,6 +452,11 @@ def ode_scrapper(
     logger.debug(f"[scrap] Processing each model...")
     output = list()
     for i, (name, ref, is_poly) in enumerate(references):
+        if use_cache and len(references) > 1 and i % __PREFETCH_BLOCK == 0:
+            ## We download the next block of models concurrently
+            prefetch_models(
+                base_url, [ref for (_, ref, _) in references[i : i + __PREFETCH_BLOCK]]
+            )
         logger.debug(f"[scrap] Processing model {name} ({i+1}/{len(references)})...")
         try:
             output.append(
@@ -336,6 +466,7 @@ def ode_scrapper(
                     name=name,
                     transform_names=translation,
                     polynomial=is_poly,
+                    use_cache=use_cache,
                 )
             )
         except (TypeError, ValueError):  # We first try to simplify the reading
@@ -347,6 +478,7 @@ def ode_scrapper(
                         name=name,
                         transform_names=translation,
                         polynomial=False,
+                        use_cache=use_cache,
                     )
                 )
             except (TypeError, ValueError):
@@ -358,6 +490,7 @@ def ode_scrapper(
                             name=name,
                             transform_names=False,
                             polynomial=is_poly,
+                            use_cache=use_cache,
                         )
                     )
                 except (TypeError, ValueError):
@@ -369,6 +502,7 @@ def ode_scrapper(
                                 name=name,
                                 transform_names=False,
                                 polynomial=False,
+                                use_cache=use_cache,
                             )
                         )
                     except (TypeError, ValueError):
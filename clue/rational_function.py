@@ -1,17 +1,10 @@
+import math
+import random
 import re
 
-from functools import cached_property, reduce
-
-from pyparsing import (
-    Literal,
-    ParseException,
-    Group,
-    Forward,
-    alphas,
-    alphanums,
-    Regex,
-    Suppress,
-)
+from collections import namedtuple
+from functools import cached_property, lru_cache
+
 
 import sympy
 from sympy import QQ, oo
@@ -23,20 +16,136 @@ from .nual import NualNumber
 
 
 def to_rational(s):
-    denom = 1
-    extra_num = 1
-    if ("E" in s) or ("e" in s):
-        s, exp = re.split("[Ee]", s)
-        if exp[0] == "-":
-            denom = 10 ** (-int(exp))
+    r"""
+    Exact rational number written in ``s`` (in standard or scientific notation).
+
+    Examples::
+
+        >>> from clue.rational_function import to_rational
+        >>> to_rational("-2.5e3"), to_rational("0.125"), to_rational("12E-2"), to_rational("7.")
+        (MPQ(-2500,1), MPQ(1,8), MPQ(3,25), MPQ(7,1))
+    """
+    mantissa, _, exp = s.replace("E", "e").partition("e")
+    integer, _, decimals = mantissa.partition(".")
+    ## the number is integer*10**len(decimals) + decimals times 10**(exp - len(decimals))
+    exp = (int(exp) if exp else 0) - len(decimals)
+    if exp >= 0:
+        return QQ(int(integer + decimals) * 10**exp, 1)
+    return QQ(int(integer + decimals), 10 ** (-exp))
+
+
+## the same literals (exponents, small coefficients) are read many times in a system
+_to_rational = lru_cache(maxsize=1024)(to_rational)
+
+
+# ------------------------------------------------------------------------------
+class RationalFunctionParseError(ValueError):
+    r"""
+    Exception raised when a string can not be read by :func:`RationalFunction.from_string`.
+
+    The string is stored in ``expression`` and the position of the error in ``loc``, so the
+    caller can report (or collect) the failing expressions.
+
+    Examples::
+
+        >>> from clue.rational_function import RationalFunctionParseError
+        >>> try:
+        ...     RationalFunction.from_string("x*(y + 1", ["x", "y"])
+        ... except RationalFunctionParseError as error:
+        ...     print(error.expression, error.loc)
+        x*(y + 1 8
+    """
+
+    def __init__(self, expression, loc, msg):
+        super().__init__(f"{msg} (at char {loc} of {expression!r})")
+        self.expression = expression
+        self.loc = loc
+        self.msg = msg
+
+
+## Tokens of the expressions read by :func:`RationalFunction.from_string`: numbers (in standard
+## or scientific notation), names of variables and operators (``^`` is a synonym of ``**``)
+_TOKEN = re.compile(
+    r"\s*(?:(\d+(?:\.\d*)?(?:[eE][+-]?\d+)?)|([A-Za-z][A-Za-z0-9_$]*)|(\*\*|[-+*/^()]))"
+)
+## precedence and right associativity of the binary operators (the unary minus has precedence 3)
+_PRECEDENCE = {"+": 1, "-": 1, "*": 2, "/": 2, "unary -": 3, "^": 4, "**": 4}
+_RIGHT_ASSOCIATIVE = {"^", "**"}
+
+
+def _to_postfix(s):
+    r"""
+    Tokens of the expression ``s`` in postfix order (Dijkstra's shunting-yard algorithm).
+
+    Operators and names are strings, numbers are tuples with their string (so no token needs to
+    be matched again to know its kind) and a negation is the token ``"unary -"``. The unary
+    minus binds tighter than products but looser than powers, as in Python.
+
+    Examples::
+
+        >>> from clue.rational_function import _to_postfix
+        >>> _to_postfix("x*(y + 2.5)")
+        ['x', 'y', ('2.5',), '+', '*']
+        >>> _to_postfix("-x**2 - y/z")
+        ['x', ('2',), '**', 'unary -', 'y', 'z', '/', '-']
+        >>> _to_postfix("x + * y")
+        Traceback (most recent call last):
+        ...
+        clue.rational_function.RationalFunctionParseError: Expected an operand (at char 4 of 'x + * y')
+    """
+    output, operators = [], []
+    expect_operand = True
+    pos = 0
+    while True:
+        token = _TOKEN.match(s, pos)
+        if token is None:
+            break
+        pos = token.end()
+        number, name, op = token.groups()
+        if expect_operand:
+            if op is None:
+                output.append(name if number is None else (number,))
+                expect_operand = False
+            elif op == "-":
+                operators.append("unary -")
+            elif op == "(":
+                operators.append(op)
+            elif op != "+":
+                raise RationalFunctionParseError(s, token.start(3), "Expected an operand")
+        elif op == ")":
+            while operators and operators[-1] != "(":
+                output.append(operators.pop())
+            if not operators:
+                raise RationalFunctionParseError(s, token.start(3), "Unbalanced ')'")
+            operators.pop()
+        elif op in _PRECEDENCE:
+            precedence = _PRECEDENCE[op]
+            while operators and operators[-1] != "(":
+                top = _PRECEDENCE[operators[-1]]
+                if top < precedence or (top == precedence and op in _RIGHT_ASSOCIATIVE):
+                    break
+                output.append(operators.pop())
+            operators.append(op)
+            expect_operand = True
         else:
-            extra_num = 10 ** (int(exp))
+            raise RationalFunctionParseError(s, token.start(token.lastindex), "Expected an operator")
+
+    rest = s[pos:].lstrip()
+    if rest:
+        raise RationalFunctionParseError(s, len(s) - len(rest), "Unexpected character")
+    if expect_operand:
+        raise RationalFunctionParseError(s, pos, "Expected an operand")
+    while operators:
+        op = operators.pop()
+        if op == "(":
+            raise RationalFunctionParseError(s, pos, "Unbalanced '('")
+        output.append(op)
+    return output
 
-    frac = s.split(".")
-    if len(frac) == 1:
-        return QQ(int(s) * extra_num, denom)
-    return QQ(int(frac[0] + frac[1]) * extra_num, denom * 10 ** (len(frac[1])))
 
+## Strings that are just a number or a (power of a) variable do not need to be parsed
+_NUMBER = re.compile(r"\s*([+-]?\d+(?:\.\d*)?(?:[eE][+-]?\d+)?)\s*")
+_VARIABLE_POWER = re.compile(r"\s*([A-Za-z][A-Za-z0-9_$]*)(?:\s*(?:\*\*|\^)\s*(\d+))?\s*")
 
 # ------------------------------------------------------------------------------
 
@@ -67,9 +176,28 @@ class SparsePolynomial(object):
         True
     """
 
+    ## no per-instance ``__dict__``: the cached values have their own slots (see :func:`_reset_caches`)
+    __slots__ = (
+        "_varnames",
+        "_domain",
+        "_data",
+        "_hash",
+        "_sympy_cache",
+        "_horner_cache",
+        "_evaluator_cache",
+        "_varindex_cache",
+        "_linear_cache",
+    )
+
     def __init__(self, varnames, domain=QQ, data=None, cast=True):
         self._varnames = varnames
         self._domain = domain
+        self._hash = None
+        self._sympy_cache = None
+        self._horner_cache = None
+        self._evaluator_cache = None
+        self._varindex_cache = None
+        self._linear_cache = None
         if cast:
             self._data = (
                 dict()
@@ -87,6 +215,49 @@ class SparsePolynomial(object):
                 else {key: data[key] for key in data if data[key] != 0}
             )
 
+    def _reset_caches(self):
+        r"""Removes the values cached from ``self._data`` (must be called when it is modified in-place)"""
+        self._hash = None
+        self._sympy_cache = None
+        self._horner_cache = None
+        self._evaluator_cache = None
+        self._linear_cache = None
+
+    @property
+    def _var_index(self):
+        r"""
+        Dictionary from the names of the variables to their index in ``self._varnames`` (computed once).
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> SparsePolynomial.from_string("x*z + y", ['x','y','z'])._var_index
+            {'x': 0, 'y': 1, 'z': 2}
+        """
+        if self._varindex_cache is None:
+            self._varindex_cache = {name: i for i, name in enumerate(self._varnames)}
+        return self._varindex_cache
+
+    def __getstate__(self):
+        r"""
+        State for :mod:`pickle`: the cached values are not stored.
+
+        Examples::
+
+            >>> import pickle
+            >>> from clue.rational_function import *
+            >>> sp = SparsePolynomial.from_string("x*y + 2", ['x','y'])
+            >>> _ = sp._sympy_poly, sp.numerical_evaluator
+            >>> pickle.loads(pickle.dumps(sp)) == sp
+            True
+        """
+        return (self._varnames, self._domain, self._data)
+
+    def __setstate__(self, state):
+        varnames, domain, data = state
+        SparsePolynomial.__init__(self, varnames, domain)
+        self._data = data
+
     def dataiter(self):
         return self._data.items()
 
@@ -138,11 +309,10 @@ class SparsePolynomial(object):
             >>> p == sum([p.coefficients[i]*p.monomials[i] for i in range(n)], SparsePolynomial(p.gens, p.domain))
             True
         """
+        varnames, domain = self._varnames, self.domain
         return tuple(
-            [
-                SparsePolynomial.monomial(term[0], self._varnames, self.domain)
-                for term in self.dataiter()
-            ]
+            SparsePolynomial.monomial(monomial, varnames, domain)
+            for monomial in self._data
         )
 
     @property
@@ -181,7 +351,7 @@ class SparsePolynomial(object):
             >>> p == sum([p.coefficients[i]*p.monomials[i] for i in range(n)], SparsePolynomial(p.gens, p.domain))
             True
         """
-        return tuple([el[1] for el in self.dataiter()])
+        return tuple(self._data.values())
 
     @property
     def content(self):
@@ -218,7 +388,23 @@ class SparsePolynomial(object):
             >>> p.content
             0
         """
-        return sympy.polys.polytools.gcd(self.coefficients)
+        coefficients = self.coefficients
+        if self.domain == QQ and len(coefficients) > 1:
+            ## same reduction as QQ.gcd, folded on plain integers
+            first = coefficients[0]
+            numer, denom = abs(first.numerator), first.denominator
+            for c in coefficients[1:]:
+                numer = math.gcd(numer, c.numerator)
+                denom = math.lcm(denom, c.denominator)
+                common = math.gcd(numer, denom)
+                if common != 1:
+                    numer, denom = numer // common, denom // common
+                if numer == 1 and denom == 1:
+                    break
+            return sympy.Rational(numer, denom)
+        elif self.domain == QQ and coefficients:
+            return QQ.to_sympy(coefficients[0])
+        return sympy.polys.polytools.gcd(coefficients)
 
     @property
     def constant_term(self):
@@ -345,23 +531,23 @@ class SparsePolynomial(object):
         """
         if var_name is None:
             degree_fun = lambda monomial: sum(el[1] for el in monomial)
-        elif var_name not in self._varnames:
+        elif var_name not in self._var_index:
             raise ValueError(
                 "the variable %s is not valid for this polynomial" % var_name
             )
         else:
+            var_index = self._var_index[var_name]
 
             def degree_fun(monomial):
-                var_index = self._varnames.index(var_name)
-                red = [el for el in monomial if el[0] == var_index]
-                if len(red) == 0:
-                    return 0
-                return red[0][1]
+                for v, e in monomial:
+                    if v == var_index:
+                        return e
+                return 0
 
         if self.is_zero():
             return oo
 
-        return max([degree_fun(term[0]) for term in self.dataiter()])
+        return max(degree_fun(monomial) for monomial in self._data)
 
     def variables(self, as_poly=False):
         r"""
@@ -402,14 +588,14 @@ class SparsePolynomial(object):
             >>> SparsePolynomial(["x", "y", "z"], QQ).variables() # checking the zero polynomial
             ()
         """
-        var_index = list(
-            set(sum([[var[0] for var in term[0]] for term in self.dataiter()], []))
-        )
+        var_index = sorted({var for monomial in self._data for var, _ in monomial})
 
-        result = [self._varnames[var_index[i]] for i in range(len(var_index))]
+        result = [self._varnames[i] for i in var_index]
         if as_poly:
             result = [
-                SparsePolynomial.var_from_string(name, self._varnames)
+                SparsePolynomial.var_from_string(
+                    name, self._varnames, self.domain, self._var_index
+                )
                 for name in result
             ]
 
@@ -427,15 +613,20 @@ class SparsePolynomial(object):
                 return NotImplemented
 
         result = SparsePolynomial(self._varnames, self.domain)
-        resdata = dict()
-        for m, c in self._data.items():
-            sum_coef = c + other._data.get(m, self.domain(0))
-            if sum_coef != 0:
-                resdata[m] = sum_coef
-
+        ## single pass over ``other`` on a copy of the data of ``self`` (the order of the terms
+        ## is kept: those of ``self`` followed by the new ones from ``other``)
+        resdata = self._data.copy()
+        get = resdata.get
         for m, c in other._data.items():
-            if m not in self._data:
+            prev = get(m)
+            if prev is None:
                 resdata[m] = c
+            else:
+                sum_coef = prev + c
+                if sum_coef != 0:
+                    resdata[m] = sum_coef
+                else:
+                    del resdata[m]
         result._data = resdata
         return result
 
@@ -453,13 +644,15 @@ class SparsePolynomial(object):
             else:
                 return NotImplemented
 
+        self._reset_caches()
+        data = self._data
+        zero, get = self.domain.zero, data.get
         for m, c in other._data.items():
-            sum_coef = c + self._data.get(m, self.domain(0))
+            sum_coef = c + get(m, zero)
             if sum_coef != 0:
-                self._data[m] = sum_coef
-            else:
-                if m in self._data:
-                    del self._data[m]
+                data[m] = sum_coef
+            elif m in data:
+                del data[m]
         return self
 
     # --------------------------------------------------------------------------
@@ -518,6 +711,8 @@ class SparsePolynomial(object):
         """
         if not isinstance(other, SparsePolynomial):
             if isinstance(other, RationalFunction):
+                if self.is_zero():
+                    return other.numer.is_zero()
                 return self * other.denom == other.numer
             elif other in self.domain:
                 other = SparsePolynomial.from_const(other, self._varnames, self.domain)
@@ -525,19 +720,77 @@ class SparsePolynomial(object):
                 other = SparsePolynomial.from_string(other, self._varnames, self.domain)
             else:
                 return False
-        if self._data != other._data:
+        ## cheap checks before comparing all the coefficients
+        if len(self._data) != len(other._data):
             return False
-        else:
-            return True
+        if (
+            self._hash is not None
+            and other._hash is not None
+            and self._hash != other._hash
+        ):
+            return False
+        return self._data == other._data
 
     def __hash__(self) -> int:
-        r"""Method to get the hash of a SparsePolynomial"""
-        return hash(tuple(self._data)) * hash(
-            tuple(SparsePolynomial.from_const(1, self.variables(), self.domain)._data)
-        )
+        r"""
+        Method to get the hash of a SparsePolynomial.
+
+        The hash only depends on the monomials of the polynomial (not on their order) and it is
+        computed only once (see :func:`_reset_caches`).
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> sp1 = SparsePolynomial.from_string("x*y + 3*x - 1", ['x','y'])
+            >>> sp2 = SparsePolynomial.from_string("3*x - 1 + y*x", ['x','y'])
+            >>> sp1 == sp2 and hash(sp1) == hash(sp2)
+            True
+            >>> h = hash(sp1); sp1 += SparsePolynomial.from_string("y", ['x','y'])
+            >>> hash(sp1) == h
+            False
+        """
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data))
+        return self._hash
 
     # --------------------------------------------------------------------------
 
+    @staticmethod
+    def _mul_monomials(ml, mr):
+        r"""
+        Product of two monomials (as stored in ``_data``), merging their sorted pairs ``(index, exponent)``.
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> SparsePolynomial._mul_monomials(((0, 1), (2, 3)), ((1, 2), (2, 1)))
+            ((0, 1), (1, 2), (2, 4))
+            >>> SparsePolynomial._mul_monomials((), ((1, 2),))
+            ((1, 2),)
+        """
+        if not ml:
+            return mr
+        if not mr:
+            return ml
+        result = []
+        i = j = 0
+        nl, nr = len(ml), len(mr)
+        while i < nl and j < nr:
+            vl, vr = ml[i][0], mr[j][0]
+            if vl < vr:
+                result.append(ml[i])
+                i += 1
+            elif vr < vl:
+                result.append(mr[j])
+                j += 1
+            else:
+                result.append((vl, ml[i][1] + mr[j][1]))
+                i += 1
+                j += 1
+        result.extend(ml[i:])
+        result.extend(mr[j:])
+        return tuple(result)
+
     def __mul__(self, other):
         """
         Multiplication by a scalar or another polynomial
@@ -545,22 +798,23 @@ class SparsePolynomial(object):
         """
         if type(other) == SparsePolynomial:
             result = SparsePolynomial(self._varnames, self.domain)
+            mul_monomials = SparsePolynomial._mul_monomials
+            resdata = dict()
+            get = resdata.get
+            right = list(other._data.items())
             for ml, cl in self._data.items():
-                for mr, cr in other._data.items():
-                    dictl = dict(ml)
-                    dictr = dict(mr)
-                    for varind, exp in dictr.items():
-                        if varind in dictl:
-                            dictl[varind] += exp
-                        else:
-                            dictl[varind] = exp
-                    m = tuple([(v, dictl[v]) for v in sorted(dictl.keys())])
-                    if m in result._data:
-                        result._data[m] += cl * cr
-                        if result._data[m] == 0:
-                            del result._data[m]
+                for mr, cr in right:
+                    m = mul_monomials(ml, mr)
+                    c = get(m)
+                    if c is None:
+                        resdata[m] = cl * cr
                     else:
-                        result._data[m] = cl * cr
+                        c += cl * cr
+                        if c == 0:
+                            del resdata[m]
+                        else:
+                            resdata[m] = c
+            result._data = resdata
             return result
         else:
             result = SparsePolynomial(self._varnames, self.domain)
@@ -578,6 +832,50 @@ class SparsePolynomial(object):
 
     # --------------------------------------------------------------------------
 
+    def _divide_by_term(self, other):
+        r"""
+        Division of ``self`` by a polynomial with only one term, computed without SymPy.
+
+        If ``other`` is a single term over the same variables and domain (which must be a field),
+        the quotient is formed by the terms of ``self`` divisible by ``other`` and the remainder
+        by the remaining terms. Otherwise, this method returns ``None``.
+
+        Output
+            A pair ``(quotient, remainder)`` of :class:`SparsePolynomial` or ``None``.
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> sp1 = SparsePolynomial.from_string("x**3*y + 3*x*y**2 + 4*x + 5", ['x','y'])
+            >>> sp2 = SparsePolynomial.from_string("2*x*y", ['x','y'])
+            >>> sp1._divide_by_term(sp2)
+            (1/2*x**2 + 3/2*y, 4*x + 5)
+            >>> sp1._divide_by_term(sp1) is None
+            True
+        """
+        if (
+            len(other._data) != 1
+            or other._varnames != self._varnames
+            or other.domain != self.domain
+            or not self.domain.is_Field
+        ):
+            return None
+        ((mr, cr),) = other._data.items()
+        if cr == 0:
+            return None
+        divisor = dict(mr)
+        quo, rem = dict(), dict()
+        for m, c in self._data.items():
+            exps = dict(m)
+            if all(exps.get(v, 0) >= e for v, e in divisor.items()):
+                quo[tuple((v, e - divisor.get(v, 0)) for v, e in m if e != divisor.get(v, 0))] = c / cr
+            else:
+                rem[m] = c
+        return (
+            SparsePolynomial(self._varnames, self.domain, quo, cast=False),
+            SparsePolynomial(self._varnames, self.domain, rem, cast=False),
+        )
+
     def __floordiv__(self, other):
         r"""
         Exact division implemented with SymPy.
@@ -606,7 +904,7 @@ class SparsePolynomial(object):
             >>> sp1 = SparsePolynomial.from_string("x**3 + 3*x**2 + 4*x + 5", ['x','y'])
             >>> sp2 = SparsePolynomial.from_string("x+1", ['x'])
             >>> sp1//sp2
-            2 + x**2 + 2*x
+            x**2 + 2*x + 2
 
         **Warning:** when the variables of the divisor are not included in the variables of the dividend,
         some weird phenomena could happen::
@@ -614,12 +912,12 @@ class SparsePolynomial(object):
             >>> sp1 = SparsePolynomial.from_string("x**3 + 3*x**2 + 4*x + 5", ['x','y'])
             >>> sp2 = SparsePolynomial.from_string("x+y", ['x','y'])
             >>> sp1//sp2
-            4 + x**2 + y**2 - 3*y + 3*x - x*y
+            x**2 - x*y + 3*x + y**2 - 3*y + 4
             >>> sp3 =  SparsePolynomial.from_string("x**3 + 3*x**2 + 4*x + 5", ['x'])
             >>> sp3 == sp1
             True
             >>> sp3//sp2
-            2 + x**2 + 2*x
+            x**2 + 2*x + 2
         """
         if self.is_zero():
             return SparsePolynomial.from_const(0, self._varnames, self.domain)
@@ -630,12 +928,14 @@ class SparsePolynomial(object):
                 self.ct / other.ct, self._varnames, self.domain
             )
 
+        ## Division by a monomial (no need to use SymPy)
+        split = self._divide_by_term(other)
+        if split is not None:
+            return split[0]
+
         ## General case (self != other and 0)
-        R = self.get_sympy_ring()
-        num = R(self.get_sympy_dict()).as_expr()
-        denom = R(other.get_sympy_dict()).as_expr()
-        quo = R(sympy.polys.polytools.quo(num, denom))
-        return SparsePolynomial.from_sympy(quo)
+        quo = self._sympy_poly.quo(self._sympy_operand(other))
+        return SparsePolynomial.from_sympy(quo, self._varnames)
 
     def __mod__(self, other):
         r"""
@@ -673,24 +973,27 @@ class SparsePolynomial(object):
             >>> sp1 = SparsePolynomial.from_string("x**3 + 3*x**2 + 4*x + 5", ['x','y'])
             >>> sp2 = SparsePolynomial.from_string("x+y", ['x','y'])
             >>> sp1%sp2
-            5 - y**3 - 4*y + 3*y**2
+            -y**3 + 3*y**2 - 4*y + 5
             >>> sp3 =  SparsePolynomial.from_string("x**3 + 3*x**2 + 4*x + 5", ['x'])
             >>> sp3 == sp1
             True
             >>> sp3%sp2
             3
         """
-        R = self.get_sympy_ring()
-        num = R(self.get_sympy_dict()).as_expr()
-        denom = R(other.get_sympy_dict()).as_expr()
-        if num.is_zero:
+        num = self._sympy_poly
+        denom = self._sympy_operand(other)
+        if not num:
             return SparsePolynomial.from_string("0", self._varnames, self.domain)
         elif num == denom:
             return SparsePolynomial.from_const(1, self._varnames, self.domain)
         elif denom == 1:
             return self
-        quo = R(sympy.polys.polytools.rem(num, denom))
-        return SparsePolynomial.from_sympy(quo)
+
+        split = self._divide_by_term(other)
+        if split is not None:
+            return split[1]
+        rem = num.rem(denom)
+        return SparsePolynomial.from_sympy(rem, self._varnames)
 
     def __truediv__(self, other):
         r"""
@@ -794,53 +1097,234 @@ class SparsePolynomial(object):
             0
         """
         # analyzing the values given
-        rem_variables = [el for el in self.gens]
-        for el in values:
-            if el in rem_variables:
-                rem_variables.remove(el)
+        rem_variables = [el for el in self._varnames if el not in values]
 
-        rem_variables_indices = [self._varnames.index(el) for el in rem_variables]
+        ## new index for each of the remaining variables
+        index = self._var_index
+        new_index = {index[el]: i for i, el in enumerate(rem_variables)}
         values = {
-            self._varnames.index(el): (
+            index[el]: (
                 values[el].change_base(self.domain)
                 if isinstance(values[el], NualNumber)
                 else self.domain.convert(values[el])
             )
             for el in values
-            if el in self._varnames
+            if el in index
         }
-        ## Here `rem_variables_indices` contains the indices of the variables remaining in the evaluation
+        ## Here `new_index` contains the indices of the variables remaining in the evaluation
         ## and values `values` contains a dictionary index -> value (instead of the name of the variable)
 
+        if not rem_variables:  # all variables are evaluated: we use the Horner scheme
+            return SparsePolynomial(
+                rem_variables,
+                self.domain,
+                {
+                    (): SparsePolynomial._eval_horner(self._horner_plan, values)
+                    if type(self._horner_plan) is tuple
+                    else self._horner_plan
+                },
+                cast=False,
+            )
+
+        ## table of the powers of the values that are needed for the evaluation
+        max_exp = {}
+        for monomial in self._data:
+            for v, e in monomial:
+                if v in values and e > max_exp.get(v, 0):
+                    max_exp[v] = e
+        powers = {}
+        for v, e in max_exp.items():
+            table = [None, values[v]]
+            for _ in range(e - 1):
+                table.append(table[-1] * values[v])
+            powers[v] = table
+
         new_data = {}
+        zero = self.domain.zero
         for monomial, coefficient in self._data.items():
-            ## cleaning from monomial the variables evaluated
-            new_monomial = tuple(
-                [
-                    (rem_variables_indices.index(v), e)
-                    for (v, e) in monomial
-                    if v in rem_variables_indices
-                ]
-            )
-            ## computing the new coefficient for the new monomial
-            value = reduce(
-                lambda p, q: p * q,
-                [coefficient]
-                + [
-                    values[v] ** e
-                    for v, e in monomial
-                    if not v in rem_variables_indices
-                ],
-            )
+            ## cleaning from monomial the variables evaluated while computing the new coefficient
+            new_monomial = []
+            value = coefficient
+            for v, e in monomial:
+                if v in powers:
+                    value = value * powers[v][e]
+                else:
+                    new_monomial.append((new_index[v], e))
+            new_monomial = tuple(new_monomial)
 
             ## adding the new monomial
-            if not new_monomial in new_data:
-                new_data[new_monomial] = self.domain.zero
-            new_data[new_monomial] += value
+            new_data[new_monomial] = new_data.get(new_monomial, zero) + value
 
         ## Returning the resulting polynomial (only remaining variables appear in the polynomial)
         return SparsePolynomial(rem_variables, self.domain, new_data, cast=False)
 
+    def eval_numeric(self, *args):
+        r"""
+        Evaluation of the polynomial at a point given by scalars, returning a scalar.
+
+        Contrary to :func:`eval`, no :class:`SparsePolynomial` is built: the values are given
+        positionally following the order in ``self.gens`` and the Horner scheme of ``self``
+        is evaluated directly. If some value is a ``float`` or a ``complex``, the evaluation is
+        done with :func:`numerical_evaluator`. Otherwise the values are converted into
+        ``self.domain`` and the result is an element of ``self.domain``.
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> sp = SparsePolynomial.from_string("x**3*y + 2*x + 5*y**2 + 1/2", ['x','y'])
+            >>> sp.eval_numeric(2, 3)
+            MPQ(147,2)
+            >>> sp.eval_numeric(2.0, 3)
+            73.5
+            >>> sp.eval_numeric(QQ(1,2), 0)
+            MPQ(3,2)
+            >>> SparsePolynomial(['x']).eval_numeric(5)
+            MPQ(0,1)
+            >>> sp.eval_numeric(1)
+            Traceback (most recent call last):
+            ...
+            ValueError: Expected 2 values for the evaluation, got 1
+        """
+        if len(args) != len(self._varnames):
+            raise ValueError(
+                f"Expected {len(self._varnames)} values for the evaluation, got {len(args)}"
+            )
+        if any(isinstance(arg, (float, complex)) for arg in args):
+            return self.numerical_evaluator(*args)
+        plan = self._horner_plan
+        if type(plan) is not tuple:
+            return plan
+        domain = self.domain
+        return SparsePolynomial._eval_horner(plan, [domain.convert(arg) for arg in args])
+
+    def eval_batch(self, **values):
+        r"""
+        Numerical evaluation of the polynomial at many points at once (using NumPy).
+
+        Input
+            values - dictionary containing the names of (at least) all the variables appearing in ``self``
+            and arrays (or lists) with the value of that variable at each point. All arrays must have
+            compatible shapes (see NumPy broadcasting).
+
+        Output
+            A ``numpy.ndarray`` of floats with the values of ``self`` at each of the points.
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> sp = SparsePolynomial.from_string("x**2*z + y - 1", ['x','y','z'])
+            >>> sp.eval_batch(x=[0, 1, 2], y=[1, 2, 0.5], z=[3, 3, 1/2])
+            array([0. , 4. , 1.5])
+            >>> sp.eval_batch(x=[0, 1, 2], y=2, z=1)
+            array([1., 2., 5.])
+            >>> sp.eval_batch(x=[1, 2])
+            Traceback (most recent call last):
+            ...
+            ValueError: Not enough variables were given for evaluation. Required ('x', 'y', 'z'), given ['x']
+        """
+        from numpy import asarray, broadcast_shapes, zeros
+
+        variables = self.variables()
+        if any(v not in values for v in variables):
+            raise ValueError(
+                f"Not enough variables were given for evaluation. Required {variables}, given {list(values.keys())}"
+            )
+        points = {
+            self._var_index[v]: asarray(values[v], dtype=float) for v in variables
+        }
+        shape = broadcast_shapes(*(asarray(el).shape for el in values.values()))
+
+        ## table with the powers needed of each variable (computed by repeated multiplication)
+        max_exp = {}
+        for monomial in self._data:
+            for v, e in monomial:
+                if e > max_exp.get(v, 0):
+                    max_exp[v] = e
+        powers = {}
+        for v, e in max_exp.items():
+            table = [None, points[v]]
+            for _ in range(e - 1):
+                table.append(table[-1] * points[v])
+            powers[v] = table
+
+        result = zeros(shape)
+        for monomial, coefficient in self._data.items():
+            term = float(coefficient)
+            for v, e in monomial:
+                term = term * powers[v][e]
+            result += term
+        return result
+
+    @property
+    def _horner_plan(self):
+        r"""
+        Nested Horner scheme of ``self`` used by :func:`eval` (see :func:`_build_horner`).
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> sp = SparsePolynomial.from_string("x**3*y + 2*x + 5*y**2 + 1", ['x','y'])
+            >>> sp._horner_plan
+            (0, (1, MPQ(1,1), ((1, None),)), ((2, MPQ(2,1)), (1, (1, MPQ(5,1), ((2, MPQ(1,1)),)))))
+            >>> sp.eval(x=2, y=3)
+            74
+        """
+        if self._horner_cache is None:
+            self._horner_cache = SparsePolynomial._build_horner(
+                list(self._data.items()), self.domain.zero
+            )
+        return self._horner_cache
+
+    @staticmethod
+    def _build_horner(terms, zero):
+        r"""
+        Builds a Horner scheme for the list of pairs ``(monomial, coefficient)``.
+
+        The scheme is either a coefficient (if all the monomials are `1`) or a tuple
+        ``(v, top, steps)``, where ``v`` is the smallest variable index in ``terms``. Writing
+        the terms as a polynomial in ``x_v`` whose coefficients are again schemes (where ``x_v``
+        does not appear), ``top`` is the coefficient of the highest power and ``steps`` contains
+        pairs ``(gap, coefficient)`` for the lower powers in decreasing order, where ``gap``
+        is the difference with the previous power. The constant coefficient is ``None`` if it is zero.
+        """
+        var = min((m[0][0] for m, _ in terms if m), default=None)
+        if var is None:
+            return sum((c for _, c in terms), zero)
+
+        groups = {0: []}
+        for m, c in terms:
+            if m and m[0][0] == var:
+                groups.setdefault(m[0][1], []).append((m[1:], c))
+            else:
+                groups[0].append((m, c))
+        exps = sorted(groups, reverse=True)
+        steps = tuple(
+            (
+                exps[i] - exps[i + 1],
+                SparsePolynomial._build_horner(groups[exps[i + 1]], zero)
+                if groups[exps[i + 1]]
+                else None,
+            )
+            for i in range(len(exps) - 1)
+        )
+        return (var, SparsePolynomial._build_horner(groups[exps[0]], zero), steps)
+
+    @staticmethod
+    def _eval_horner(plan, values):
+        r"""Evaluates a Horner scheme (see :func:`_build_horner`) at ``values`` (dictionary index -> value)"""
+        var, top, steps = plan
+        x = values[var]
+        result = SparsePolynomial._eval_horner(top, values) if type(top) is tuple else top
+        for gap, child in steps:
+            result = result * (x if gap == 1 else x**gap)
+            if child is not None:
+                result = result + (
+                    SparsePolynomial._eval_horner(child, values)
+                    if type(child) is tuple
+                    else child
+                )
+        return result
+
     def subs(self, to_subs=None, **values):
         r"""
         More generic method that allows to substitute in a SparsePolynomial all the appearing variables.
@@ -869,15 +1353,115 @@ class SparsePolynomial(object):
             )
 
         # we assume the user has provided everything of the same type
-        to_sub = {self._varnames.index(k): v for (k, v) in values.items()}
-        prod = lambda g: reduce(lambda p, q: p * q, g, 1)
-        return sum(
-            (c * prod(to_sub[v] ** e for (v, e) in m)) for (m, c) in self._data.items()
-        )
+        index = self._var_index
+        to_sub = {index[k]: v for (k, v) in values.items()}
+        ## the powers of the substituted values are shared among the monomials
+        powers = {}
+        result = 0
+        for monomial, coeff in self._data.items():
+            term = coeff
+            for pair in monomial:
+                power = powers.get(pair)
+                if power is None:
+                    v, e = pair
+                    power = powers[pair] = to_sub[v] if e == 1 else to_sub[v] ** e
+                term = term * power
+            ## ``result`` is always a new object (``0 + term`` at the first step)
+            result += term
+        return result
 
-    @cached_property
+    @property
     def numerical_evaluator(self):
-        return eval(f"lambda {','.join(self._varnames)}: {str(self)}")
+        r"""
+        Python function evaluating ``self`` with the variables as positional arguments.
+
+        The body of the function follows the Horner scheme of ``self`` (see :func:`_horner_source`)
+        and only uses ``+``, ``*`` and ``**``, so it also accepts NumPy arrays, evaluating
+        ``self`` at all the points in one call (see also :func:`eval_batch`).
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> sp = SparsePolynomial.from_string("x**3*y + 2*x + 5*y**2 + 1/2", ['x','y'])
+            >>> sp.numerical_evaluator(2, 3)
+            73.5
+            >>> import numpy
+            >>> sp.numerical_evaluator(numpy.array([0, 1, 2]), numpy.array([1, 0, 3]))
+            array([ 5.5,  2.5, 73.5])
+            >>> SparsePolynomial(['x']).numerical_evaluator(1.5)
+            0
+        """
+        if self._evaluator_cache is None:
+            lines, names = [], {}
+            prefix = SparsePolynomial._temporary_prefix(self._varnames)
+            expr = self._horner_source(self._horner_plan, lines, names, prefix)
+            self._evaluator_cache = SparsePolynomial._compile_evaluator(
+                self._varnames, lines, expr
+            )
+        return self._evaluator_cache
+
+    def _horner_source(self, plan, lines, names, prefix):
+        r"""
+        Python expression for the Horner scheme ``plan`` (see :func:`_build_horner`).
+
+        Each nested scheme is computed in ``lines`` into a temporary variable (starting with
+        ``prefix``), so the resulting code has no deep nesting. The dictionary ``names`` stores
+        the temporary of each scheme, so repeated schemes are only computed once.
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> sp = SparsePolynomial.from_string("x**3*y + 2*x + 5*y**2 + 1", ['x','y'])
+            >>> lines = []
+            >>> sp._horner_source(sp._horner_plan, lines, {}, "_h")
+            '_h1'
+            >>> print("\n".join(lines))
+            _h0 = (5)*y**2 + (1)
+            _h1 = y*x**2 + (2)
+            _h1 = _h1*x + _h0
+        """
+        if type(plan) is not tuple:
+            return f"({self._scalar_to_str(plan)})"
+        if plan in names:
+            return names[plan]
+        var, top, steps = plan
+        x = self._varnames[var]
+        top = self._horner_source(top, lines, names, prefix)
+        children = [
+            None if child is None else self._horner_source(child, lines, names, prefix)
+            for _, child in steps
+        ]
+        if len(steps) == 1 and children[0] is None:  # a product: no temporary is needed
+            gap = steps[0][0]
+            power = x if gap == 1 else f"{x}**{gap}"
+            names[plan] = power if top == "(1)" else f"{top}*{power}"
+            return names[plan]
+        name = names[plan] = f"{prefix}{len(lines)}"
+        expr = top
+        for (gap, _), child in zip(steps, children):
+            power = x if gap == 1 else f"{x}**{gap}"
+            expr = power if expr == "(1)" else f"{expr}*{power}"
+            lines.append(f"{name} = {expr}" + ("" if child is None else f" + {child}"))
+            expr = name
+        return name
+
+    @staticmethod
+    def _temporary_prefix(varnames):
+        r"""Prefix for temporary names in generated code that no variable in ``varnames`` starts with"""
+        prefix = "_h"
+        while any(v.startswith(prefix) for v in varnames):
+            prefix += "_"
+        return prefix
+
+    @staticmethod
+    def _compile_evaluator(varnames, lines, expr):
+        r"""Python function with arguments ``varnames`` that runs ``lines`` and returns ``expr``"""
+        source = "\n    ".join(
+            [f"def evaluator({', '.join(varnames)}):", *lines, f"return {expr}"]
+        )
+        namespace = dict()
+        exec(source, namespace)
+        return namespace["evaluator"]
 
     def automated_diff(self, **values):
         r"""
@@ -902,9 +1486,15 @@ class SparsePolynomial(object):
 
         Examples::
 
-            TODO add the examples
+            >>> from clue.rational_function import *
+            >>> sp = SparsePolynomial.from_string("x**3*y + 2*x + 5*y**2 + 1", ['x','y','z'])
+            >>> sp.automated_diff(x=2, y=3)
+            [MPQ(74,1), MPQ(38,1), MPQ(38,1), MPQ(0,1)]
+            >>> sp.automated_diff(x=0, y=0, z=1)
+            [MPQ(1,1), MPQ(2,1), MPQ(0,1), MPQ(0,1)]
         """
-        if any(v not in values for v in self.variables()):
+        variables = self.variables()
+        if any(v not in values for v in variables):
             raise ValueError(
                 "Not enough information provided for automatic differentiation"
             )
@@ -913,18 +1503,35 @@ class SparsePolynomial(object):
         n = len(gens)
 
         if self.is_constant():
-            return NualNumber([self.domain.convert(self.ct)] + [0 for _ in range(n)])
-        to_eval = {
-            gens[i]: NualNumber(
-                [values.get(gens[i], 0)] + [1 if j == i else 0 for j in range(n)]
-            )
-            for i in range(n)
-        }
+            return NualNumber([self.domain.convert(self.ct)] + [0] * n)
+
+        ## a single sweep over the monomials: the partial derivative of a term with respect to
+        ## its `i`-th variable is the product of the factors before and after it times the
+        ## derivative of its `i`-th factor (the powers of the values are computed only once)
+        domain = self.domain
+        index = self._var_index
+        point = {index[v]: domain.convert(values[v]) for v in variables}
+        powers = {}
+
+        def power(v, e):
+            result = powers.get((v, e))
+            if result is None:
+                result = powers[(v, e)] = point[v] ** e
+            return result
 
-        result = self.eval(**to_eval).ct
-        if not isinstance(result, NualNumber):  # evaluation was zero
-            return NualNumber((n + 1) * [self.domain.convert(0)])
-        return result
+        result = [domain.zero] * (n + 1)
+        for monomial, coeff in self._data.items():
+            factors = [power(v, e) for v, e in monomial]
+            prefix = [coeff]
+            for factor in factors:
+                prefix.append(prefix[-1] * factor)
+            result[0] += prefix[-1]
+            suffix = domain.one
+            for i in range(len(monomial) - 1, -1, -1):
+                v, e = monomial[i]
+                result[v + 1] += prefix[i] * e * power(v, e - 1) * suffix
+                suffix *= factors[i]
+        return NualNumber(result, domain)
 
     # --------------------------------------------------------------------------
 
@@ -938,9 +1545,15 @@ class SparsePolynomial(object):
             return SparsePolynomial.from_const(1, self._varnames, self.domain)
         if power == 1:
             return self
-        if power % 2 == 0:
-            return self.exp(power // 2) * self.exp(power // 2)
-        return self * self.exp(power // 2) * self.exp(power // 2)
+        ## binary exponentiation: each square is computed only once
+        result, base = None, self
+        while True:
+            if power & 1:
+                result = base if result is None else result * base
+            power >>= 1
+            if not power:
+                return result
+            base = base * base
 
     # --------------------------------------------------------------------------
 
@@ -992,9 +1605,7 @@ class SparsePolynomial(object):
             >>> sp.is_unitary()
             False
         """
-        if self._data == {(): 1}:
-            return True
-        return False
+        return len(self._data) == 1 and self._data.get(()) == 1
 
     def is_constant(self):
         r"""
@@ -1014,10 +1625,31 @@ class SparsePolynomial(object):
         return self.is_zero() or (len(self._data) == 1 and () in self._data)
 
     def is_linear(self):
-        return all(
-            (monomial == () or (len(monomial) == 1 and monomial[0][1] == 1))
-            for monomial in self._data
-        )
+        r"""
+        Checks whether a polynomial has degree at most 1.
+
+        Contrary to :func:`is_zero`, :func:`is_unitary` and :func:`is_constant` (that only look at
+        the size of ``self._data``), this check goes over all the monomials, so its result is
+        computed only once (see :func:`_reset_caches`).
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> sp = SparsePolynomial.from_string("2*x + y - 3", ['x','y'])
+            >>> sp.is_linear()
+            True
+            >>> sp += SparsePolynomial.from_string("x*y", ['x','y'])
+            >>> sp.is_linear()
+            False
+            >>> SparsePolynomial(['x']).is_linear()
+            True
+        """
+        if self._linear_cache is None:
+            self._linear_cache = all(
+                (monomial == () or (len(monomial) == 1 and monomial[0][1] == 1))
+                for monomial in self._data
+            )
+        return self._linear_cache
 
     # --------------------------------------------------------------------------
 
@@ -1065,6 +1697,8 @@ class SparsePolynomial(object):
     def __repr__(self):
         if not self._data:
             return "0"
+        if self.domain == QQ:
+            return self._rational_repr()
         # at least one term is included in the polynomial
         terms = [self._monom_to_str(m, c) for m, c in self._data.items()]
 
@@ -1075,6 +1709,42 @@ class SparsePolynomial(object):
             + " ".join(" ".join(term) for term in terms[1:])
         )
 
+    def _rational_repr(self):
+        r"""
+        String representation of a nonzero polynomial over `\mathbb{Q}` (see :func:`__repr__`).
+
+        The coefficients are compared and printed directly, writing all the tokens into a single list.
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> sp = SparsePolynomial.from_string("-2*x**2*y/3 + y - 2 + z**3", ['x','y','z'])
+            >>> sp._rational_repr()
+            '-2/3*x**2*y + y - 2 + z**3'
+        """
+        varnames, one = self._varnames, self.domain.one
+        parts = []
+        append = parts.append
+        for m, c in self._data.items():
+            if c < 0:
+                append(" - ")
+                c = -c
+            else:
+                append(" + ")
+            if not m:
+                append(str(c))
+                continue
+            if c != one:
+                append(str(c))
+                append("*")
+            append(
+                "*".join(
+                    varnames[v] if e == 1 else f"{varnames[v]}**{e}" for v, e in m
+                )
+            )
+        parts[0] = "-" if parts[0] == " - " else ""
+        return "".join(parts)
+
     # --------------------------------------------------------------------------
 
     def linear_part_as_vec(self) -> SparseVector:
@@ -1088,11 +1758,14 @@ class SparsePolynomial(object):
 
     def get_sympy_dict(self):
         result = dict()
+        ## a single dense exponent list: only the entries set by each monomial are reset
+        new_monom = [0] * len(self._varnames)
         for monom, coef in self._data.items():
-            new_monom = [0] * len(self._varnames)
             for var, exp in monom:
                 new_monom[var] = exp
             result[tuple(new_monom)] = coef
+            for var, _ in monom:
+                new_monom[var] = 0
         return result
 
     # --------------------------------------------------------------------------
@@ -1101,7 +1774,7 @@ class SparsePolynomial(object):
         return self.constant_term
 
     def get_sympy_ring(self):
-        return sympy.polys.rings.ring(self._varnames, self.domain)[0]
+        return _sympy_ring(tuple(self._varnames), self.domain)
 
     def to_sympy(self):
         r"""
@@ -1130,6 +1803,30 @@ class SparsePolynomial(object):
         """
         return self.get_sympy_ring()(self.get_sympy_dict())
 
+    @property
+    def _sympy_poly(self):
+        r"""Cached version of :func:`to_sympy` (removed by the in-place operations)"""
+        if self._sympy_cache is None:
+            self._sympy_cache = self.to_sympy()
+        return self._sympy_cache
+
+    def _sympy_operand(self, other):
+        r"""Polynomial ``other`` as an element in the SymPy ring of ``self`` (see :func:`__floordiv__`)"""
+        if other._varnames == self._varnames and other.domain == self.domain:
+            return other._sympy_poly
+        ## the indices of the variables of ``other`` are interpreted in the ring of ``self``
+        ## (variables out of this ring are dropped: see the warnings in :func:`__floordiv__`)
+        R = self._sympy_poly.ring
+        data = dict()
+        for monom, coef in other._data.items():
+            new_monom = [0] * R.ngens
+            for var, exp in monom:
+                if var < R.ngens:
+                    new_monom[var] = exp
+            new_monom = tuple(new_monom)
+            data[new_monom] = data.get(new_monom, R.domain.zero) + coef
+        return R(data)
+
     def change_base(self, new_domain):
         r"""Change the domain of the SparsePolynomial and creates a copy for it"""
         return SparsePolynomial(self._varnames, new_domain, self._data, True)
@@ -1138,26 +1835,75 @@ class SparsePolynomial(object):
     def derivative(self, var_name):
         """
         Returns derivative of polynomial with respect to var_name
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> sp = SparsePolynomial.from_string("x**3*y*z**2 + 2*x*y - y**2 + 1", ['x','y','z'])
+            >>> sp.derivative("y")
+            x**3*z**2 + 2*x - 2*y
+            >>> sp.derivative("z")
+            2*x**3*y*z
+            >>> sp.derivative("t")
+            0
         """
-        if var_name in self._varnames:
-            var = self._varnames.index(var_name)
-        else:
+        var = self._var_index.get(var_name)
+        if var is None:
             return 0
 
         data = dict()
         for monom, coeff in self._data.items():
-            for i in range(len(monom)):
-                v, exp = monom[i]
+            for i, (v, exp) in enumerate(monom):
                 if v == var:
+                    ## each variable appears at most once in a monomial
                     if exp == 1:
-                        m_der = tuple(list(monom[:i]) + list(monom[(i + 1) :]))
+                        m_der = monom[:i] + monom[i + 1 :]
                     else:
-                        m_der = tuple(
-                            list(monom[:i]) + [(var, exp - 1)] + list(monom[(i + 1) :])
-                        )
+                        m_der = monom[:i] + ((var, exp - 1),) + monom[i + 1 :]
                     data[m_der] = coeff * exp
+                    break
+
+        return SparsePolynomial(self._varnames, self._domain, data, cast=False)
+
+    def jacobian(self, varnames=None):
+        r"""
+        Derivatives of ``self`` with respect to several variables (computed in one pass).
+
+        Input
+            ``varnames`` - (optional) names of the variables for the derivatives. By default,
+            all the variables in ``self.gens``.
 
-        return SparsePolynomial(self._varnames, domain=self._domain, data=data)
+        Output
+            A list with the derivative of ``self`` with respect to each variable in ``varnames``
+            (as returned by :func:`derivative`).
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> sp = SparsePolynomial.from_string("x**3*y*z**2 + 2*x*y - y**2 + 1", ['x','y','z'])
+            >>> sp.jacobian()
+            [3*x**2*y*z**2 + 2*y, x**3*z**2 + 2*x - 2*y, 2*x**3*y*z]
+            >>> sp.jacobian(['z', 't'])
+            [2*x**3*y*z, 0]
+            >>> all(sp.jacobian()[i] == sp.derivative(v) for i, v in enumerate(sp.gens))
+            True
+        """
+        datas = [dict() for _ in self._varnames]
+        for monom, coeff in self._data.items():
+            for i, (v, exp) in enumerate(monom):
+                if exp == 1:
+                    m_der = monom[:i] + monom[i + 1 :]
+                else:
+                    m_der = monom[:i] + ((v, exp - 1),) + monom[i + 1 :]
+                datas[v][m_der] = coeff * exp
+        partials = [
+            SparsePolynomial(self._varnames, self._domain, data, cast=False)
+            for data in datas
+        ]
+        if varnames is None:
+            return partials
+        index = self._var_index
+        return [partials[index[v]] if v in index else 0 for v in varnames]
 
     # --------------------------------------------------------------------------
 
@@ -1199,11 +1945,11 @@ class SparsePolynomial(object):
         """
         Returns greatest common divisor of given polynomials (computed w/ SymPy)
         """
-        polys_sp = [p.to_sympy() for p in polys]
+        polys_sp = [p._sympy_poly for p in polys]
         result = polys_sp[0]
         for p in polys_sp[1:]:
             result = result.gcd(p)
-        return SparsePolynomial.from_sympy(result)
+        return SparsePolynomial.from_sympy(result, polys[0]._varnames)
 
     # --------------------------------------------------------------------------
 
@@ -1214,19 +1960,27 @@ class SparsePolynomial(object):
         # lambda used to handle the case of the algebraic field of coefficients
         if varnames is None:
             varnames = list(map(lambda g: str(g.as_expr()), sympy_poly.ring.gens))
-        data = dict()
-        sympy_dict = sympy_poly.to_dict()
-        for monom, coef in sympy_dict.items():
-            new_monom = []
-            for i in range(len(monom)):
-                if monom[i]:
-                    new_monom.append((i, monom[i]))
-            data[tuple(new_monom)] = coef
-        return SparsePolynomial(varnames, domain, data)
+        ## the coefficients of ``sympy_poly`` are already nonzero elements of ``domain``
+        data = {
+            tuple((i, e) for i, e in enumerate(monom) if e): coef
+            for monom, coef in sympy_poly.items()
+        }
+        return SparsePolynomial(varnames, domain, data, cast=False)
 
     @staticmethod
     def from_vector(vector, varnames=None, domain=QQ):
-        r"""Static method inverse to :func:`linear_part_as_vec`"""
+        r"""
+        Static method inverse to :func:`linear_part_as_vec`
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> SparsePolynomial.from_vector([1, 0, QQ(-1, 2)], ['x','y','z'])
+            x - 1/2*z
+            >>> sp = SparsePolynomial.from_string("3*x - y", ['x','y','z'])
+            >>> SparsePolynomial.from_vector(sp.linear_part_as_vec(), ['x','y','z']) == sp
+            True
+        """
         from .linalg import SparseVector
 
         if isinstance(vector, SparseVector):
@@ -1241,27 +1995,48 @@ class SparsePolynomial(object):
                 raise TypeError(
                     f"The list must have as many elements ({len(vector)}) as variables ({len(varnames)})"
                 )
-            data = {((i, 1),): el for i, el in enumerate(list) if el != 0}
+            data = {((i, 1),): el for i, el in enumerate(vector) if el != 0}
         return SparsePolynomial(varnames, domain, data)
 
     # --------------------------------------------------------------------------
 
     @staticmethod
     def monomial(monomial, varnames, domain):
-        each_var = []
-        for pair in monomial:
-            each_var += [
-                SparsePolynomial.var_from_string(varnames[pair[0]], varnames, domain)
-                ** pair[1]
-            ]
-        result = SparsePolynomial.from_const(1, varnames, domain)
-        for el in each_var:
-            result *= el
+        r"""
+        Polynomial with only the monomial given by a tuple of pairs ``(index, exponent)``.
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> SparsePolynomial.monomial(((2, 1), (0, 3)), ['x','y','z'], QQ)
+            x**3*z
+            >>> SparsePolynomial.monomial((), ['x','y','z'], QQ)
+            1
+        """
+        monomial = tuple(sorted((v, e) for (v, e) in monomial if e != 0))
+        result = SparsePolynomial(varnames, domain)
+        result._data[monomial] = domain.one
         return result
 
     @staticmethod
-    def var_from_string(vname, varnames, domain=QQ):
-        i = varnames.index(vname)
+    def var_from_string(vname, varnames, domain=QQ, var_to_ind=None):
+        r"""
+        Polynomial given by the variable ``vname`` in ``varnames``.
+
+        The optional dictionary ``var_to_ind`` maps each name in ``varnames`` to its position,
+        avoiding the linear search in ``varnames`` when building many variables.
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> varnames = ['x','y','z']
+            >>> SparsePolynomial.var_from_string('y', varnames)
+            y
+            >>> var_to_ind = {v: i for i, v in enumerate(varnames)}
+            >>> [SparsePolynomial.var_from_string(v, varnames, QQ, var_to_ind) for v in varnames]
+            [x, y, z]
+        """
+        i = varnames.index(vname) if var_to_ind is None else var_to_ind[vname]
         return SparsePolynomial(varnames, domain, {((i, 1),): domain.one})
 
     @staticmethod
@@ -1270,7 +2045,26 @@ class SparsePolynomial(object):
 
     @staticmethod
     def from_string(s, varnames, domain=QQ):
-        return RationalFunction.from_string(s, varnames, domain).get_poly()
+        r"""
+        Parses a polynomial from a string (see :func:`RationalFunction.from_string`).
+
+        The parsed polynomials are cached (see :func:`_parse_polynomial`), so parsing again
+        the same string is cheap. The output is always a new object that can be modified safely.
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> p = SparsePolynomial.from_string("x**2 + 3*y", ['x','y'])
+            >>> p += SparsePolynomial.from_string("y", ['x','y'])
+            >>> p
+            x**2 + 4*y
+            >>> SparsePolynomial.from_string("x**2 + 3*y", ['x','y'])
+            x**2 + 3*y
+        """
+        cached = _parse_polynomial(s, tuple(varnames), domain)
+        result = SparsePolynomial(varnames, domain)
+        result._data = cached._data.copy()
+        return result
 
 
 # ------------------------------------------------------------------------------
@@ -1284,6 +2078,8 @@ class RationalFunction:
     Input:
         ``num`` - numerator SparsePolynomial
         ``denom`` - denominator SparsePolynomial
+        ``simplify`` - (optional) if ``False``, the fraction is assumed to be already simplified
+        (see :func:`simplify`)
 
     Examples::
 
@@ -1316,10 +2112,7 @@ class RationalFunction:
         True
     """
 
-    __parser = None
-    __parser_stack = []
-
-    def __init__(self, numer, denom):
+    def __init__(self, numer, denom, simplify=True):
         ## Checking the input has the correct format
         assert isinstance(numer, SparsePolynomial)
         assert isinstance(denom, SparsePolynomial)
@@ -1338,9 +2131,7 @@ class RationalFunction:
         )
 
         ## Simplifying the rational function if the denominator is not 1
-        if self._domain.is_Exact and denom != SparsePolynomial.from_const(
-            1, self.gens, self.domain
-        ):
+        if simplify and self._domain.is_Exact and not denom.is_unitary():
             self.simplify()
 
     @staticmethod
@@ -1482,6 +2273,44 @@ class RationalFunction:
         d_denom = self.denom * self.denom
         return RationalFunction(d_num, d_denom)
 
+    def jacobian(self, varnames=None):
+        r"""
+        Derivatives of ``self`` with respect to several variables.
+
+        The derivatives of the numerator and the denominator are computed in one pass
+        (see :func:`~clue.rational_function.SparsePolynomial.jacobian`) and the square of
+        the denominator is computed only once.
+
+        Input
+            ``varnames`` - (optional) names of the variables for the derivatives. By default,
+            all the variables in ``self.gens``.
+
+        Output
+            A list with the derivative of ``self`` with respect to each variable in ``varnames``
+            (as returned by :func:`derivative`).
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> rf = RationalFunction.from_string("(x**2*y)/(y + z)", ['x','y','z'])
+            >>> rf.jacobian()
+            [RationalFunction(2*x*y, y + z), RationalFunction(x**2*z, y**2 + 2*y*z + z**2), RationalFunction(-x**2*y, y**2 + 2*y*z + z**2)]
+            >>> rf.jacobian(['t', 'x'])
+            [RationalFunction(0, 1), RationalFunction(2*x*y, y + z)]
+        """
+        d_numer = self.numer.jacobian(varnames)
+        d_denom = self.denom.jacobian(varnames)
+        square = self.denom * self.denom
+        result = []
+        for dn, dd in zip(d_numer, d_denom):
+            if not isinstance(dn, SparsePolynomial) or (dn.is_zero() and dd.is_zero()):
+                result.append(RationalFunction.from_const(0, self.gens, self.domain))
+            else:
+                result.append(
+                    RationalFunction(self.denom * dn - self.numer * dd, square)
+                )
+        return result
+
     # --------------------------------------------------------------------------
     def simplify(self):
         r"""
@@ -1495,12 +2324,22 @@ class RationalFunction:
         instead, the result is stored within the same object.
         """
         # Removing the gcd of numerator and denominator (whatever Sympy finds)
-        gcd = SparsePolynomial.gcd([self.numer, self.denom])
-        if not gcd.is_unitary():
-            self.numer = self.numer // gcd
-            self.denom = self.denom // gcd
+        ## over a field, the gcd is 1 when one of them is constant or they share no variable
+        trivial_gcd = self.domain.is_Field and (
+            self.numer.is_constant()
+            or self.denom.is_constant()
+            or set(self.numer.variables()).isdisjoint(self.denom.variables())
+        )
+        if not trivial_gcd:
+            gcd = SparsePolynomial.gcd([self.numer, self.denom])
+            if not gcd.is_unitary():
+                self.numer = self.numer // gcd
+                self.denom = self.denom // gcd
+
+        self._remove_denominator_content()
 
-        # Removing the content of the denominator
+    def _remove_denominator_content(self):
+        r"""Divides numerator and denominator by the content of the denominator (in-place)"""
         c = SparsePolynomial.from_const(self.denom.content, self.gens, self.domain)
         if not c.is_unitary():
             self.numer = self.numer // c
@@ -1516,31 +2355,104 @@ class RationalFunction:
     # --------------------------------------------------------------------------
     def __mul__(self, other):
         if type(other) == RationalFunction:
+            if self.denom.is_unitary() and other.denom.is_unitary():
+                ## product of polynomials: the denominator is kept
+                return RationalFunction(self.numer * other.numer, self.denom)
             rf = RationalFunction(self.numer * other.numer, self.denom * other.denom)
         else:
-            rf = RationalFunction(self.numer * other, self.denom)
+            ## multiplying by a scalar keeps the fraction simplified
+            rf = RationalFunction(
+                self.numer * other,
+                self.denom,
+                simplify=isinstance(other, SparsePolynomial),
+            )
         return rf
 
     def __rmul__(self, other):
         return self.__mul__(other)
 
     def __add__(self, other):
+        r"""
+        Sum of rational functions.
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> r1 = RationalFunction.from_string("x/(x + y)", ['x','y'])
+            >>> r2 = RationalFunction.from_string("y/(x + y)", ['x','y'])
+            >>> r1 + r2
+            RationalFunction(1, 1)
+            >>> r1 + SparsePolynomial.from_string("x", ['x','y'])
+            RationalFunction(x + x**2 + x*y, x + y)
+            >>> r1 + 1
+            RationalFunction(2*x + y, x + y)
+            >>> r1 - r1
+            RationalFunction(0, 1)
+        """
         if type(other) == RationalFunction:
-            if self.denom == other.denom:
+            ## a shared denominator (common when accumulating terms) is not compared
+            if self.denom is other.denom or self.denom == other.denom:
                 rf = RationalFunction(self.numer + other.numer, self.denom)
+            elif self.domain.is_Exact:
+                rf = self._add_simplified(other)
             else:
                 rf = RationalFunction(
                     self.numer * other.denom + other.numer * self.denom,
                     self.denom * other.denom,
                 )
             return rf
+        ## for a polynomial `p`, `gcd(a + pb, b) = gcd(a, b) = 1`: `(a + pb)/b` is already simplified
         elif type(other) == SparsePolynomial:
-            return self + RationalFunction(
-                other, SparsePolynomial.from_const(1, self.gens, self.domain)
+            return RationalFunction(
+                self.numer + other * self.denom, self.denom, simplify=False
+            )
+        elif other in self.domain:
+            return RationalFunction(
+                self.numer + self.denom * self.domain.convert(other),
+                self.denom,
+                simplify=False,
             )
         else:
             return self + RationalFunction.from_const(other, self.gens, self.domain)
 
+    def _add_simplified(self, other):
+        r"""
+        Sum of two simplified rational functions with different denominators (over an exact domain).
+
+        Writing ``self`` as `a/b` and ``other`` as `c/d` with `g = \gcd(b, d)`, the sum is
+        `(a(d/g) + c(b/g))/(b(d/g))` and only the factors of `g` can be common to its numerator
+        and denominator (Henrici's algorithm). Hence the full simplification is avoided and
+        there is nothing to remove when the denominators are coprime.
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> r1 = RationalFunction.from_string("x/(x + y)", ['x','y'])
+            >>> r2 = RationalFunction.from_string("y/(x**2 - y**2)", ['x','y'])
+            >>> r1._add_simplified(r2)
+            RationalFunction(x**2 - x*y + y, x**2 - y**2)
+            >>> r1._add_simplified(r2) == r1 + r2
+            True
+            >>> r3 = RationalFunction.from_string("-x/(x - y)", ['x','y'])
+            >>> r1._add_simplified(r3)
+            RationalFunction(-2*x*y, x**2 - y**2)
+        """
+        g = SparsePolynomial.gcd([self.denom, other.denom])
+        if g.is_unitary():
+            numer = self.numer * other.denom + other.numer * self.denom
+            denom = self.denom * other.denom
+        else:
+            self_cofactor, other_cofactor = self.denom // g, other.denom // g
+            numer = self.numer * other_cofactor + other.numer * self_cofactor
+            denom = self.denom * other_cofactor
+            h = SparsePolynomial.gcd([numer, g])
+            if not h.is_unitary():
+                numer, denom = numer // h, denom // h
+        rf = RationalFunction(numer, denom, simplify=False)
+        if not rf.numer.is_zero():
+            rf._remove_denominator_content()
+        return rf
+
     def __radd__(self, other):
         return self.__add__(other)
 
@@ -1550,7 +2462,7 @@ class RationalFunction:
     # --------------------------------------------------------------------------
 
     def __neg__(self):
-        return RationalFunction(-self.numer, self.denom)
+        return RationalFunction(-self.numer, self.denom, simplify=False)
 
     def __sub__(self, other):
         return self + (-other)
@@ -1563,11 +2475,8 @@ class RationalFunction:
         return self
 
     def __iadd__(self, other):
-        if self.denom == other.denom:
-            self.numer += other.numer
-            return self
-        self = self + other
-        return self
+        ## a new object is always returned: the sum must be simplified (see :func:`_add_simplified`)
+        return self + other
 
     # --------------------------------------------------------------------------
     def eval(self, **values):
@@ -1613,6 +2522,32 @@ class RationalFunction:
         numer = self.numer.eval(**values)
         return numer / denom
 
+    def eval_numeric(self, *args):
+        r"""
+        Evaluation of the rational function at a point given by scalars, returning a scalar.
+
+        See method :func:`~clue.rational_function.SparsePolynomial.eval_numeric` for further information.
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> rf = RationalFunction.from_string("(x**2 + 1)/(2*y)", ['x','y'])
+            >>> rf.eval_numeric(3, 2)
+            MPQ(5,2)
+            >>> rf.eval_numeric(3, 2.0)
+            2.5
+            >>> rf.eval_numeric(3, 0)
+            Traceback (most recent call last):
+            ...
+            ZeroDivisionError: A zero from the denominator was found
+        """
+        if any(isinstance(arg, (float, complex)) for arg in args):
+            return self.numerical_evaluator(*args)
+        denom = self.denom.eval_numeric(*args)
+        if denom == 0:
+            raise ZeroDivisionError("A zero from the denominator was found")
+        return self.numer.eval_numeric(*args) / denom
+
     def subs(self, to_subs=None, **values):
         r"""
         Method to substitute variables in a rational function (not only with points)
@@ -1631,8 +2566,31 @@ class RationalFunction:
 
     @cached_property
     def numerical_evaluator(self):
-        return eval(
-            f"lambda {','.join(self._varnames)}: ({str(self.numer)})/({str(self.denom)})"
+        r"""
+        Python function evaluating ``self`` with the variables as positional arguments.
+
+        As for :func:`SparsePolynomial.numerical_evaluator`, the arguments can be NumPy arrays.
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> import numpy
+            >>> rf = RationalFunction.from_string("(x**2 + 1)/(2*y)", ['x','y'])
+            >>> rf.numerical_evaluator(3, 2)
+            2.5
+            >>> rf.numerical_evaluator(numpy.array([0, 1, 3]), 2)
+            array([0.25, 0.5 , 2.5 ])
+            >>> rf = RationalFunction.from_string("1/(x*y**2)", ['x','y'])
+            >>> rf.numerical_evaluator(2., 4.) == float(rf.eval(x=2, y=4).ct)
+            True
+        """
+        ## numerator and denominator share their temporaries (see SparsePolynomial._horner_source)
+        lines, names = [], {}
+        prefix = SparsePolynomial._temporary_prefix(self.gens)
+        numer = self.numer._horner_source(self.numer._horner_plan, lines, names, prefix)
+        denom = self.denom._horner_source(self.denom._horner_plan, lines, names, prefix)
+        return SparsePolynomial._compile_evaluator(
+            self.gens, lines, f"({numer})/({denom})"
         )
 
     def automated_diff(self, **values):
@@ -1650,7 +2608,7 @@ class RationalFunction:
         return out
 
     def get_sympy_ring(self):
-        return sympy.polys.rings.ring(self.gens, self.domain)[0]
+        return _sympy_ring(tuple(self.gens), self.domain)
 
     def change_base(self, new_domain):
         r"""Change the domain of the RationalFunction"""
@@ -1691,6 +2649,10 @@ class RationalFunction:
             False
             >>> rf1 == rf2
             True
+            >>> rf1 == RationalFunction.from_string("(2*x)/(2*y)",['x','y'])
+            True
+            >>> rf1 == RationalFunction.from_string("y/x",['x','y'])
+            False
         """
         if not isinstance(other, type(self)):
             if not isinstance(other, RationalFunction):
@@ -1698,25 +2660,94 @@ class RationalFunction:
                     other = RationalFunction.from_string(
                         str(other), self.gens, self.domain
                     )
-                except (ParseException, TypeError):
+                except (RationalFunctionParseError, TypeError):
                     return NotImplemented
+        if self.numer is other.numer and self.denom is other.denom:
+            return True
+        ## with the same denominator, only the numerators need to be compared
+        if self.denom == other.denom:
+            return self.numer == other.numer
+        ## over exact domains, different values at a random point show the inequality without
+        ## multiplying the polynomials (see :func:`_random_point`)
+        if self.domain.is_Exact and self._varnames == other._varnames:
+            point = _random_point(len(self._varnames))
+            powers = {}
+
+            def value(poly):
+                result = 0
+                for monomial, coeff in poly._data.items():
+                    for pair in monomial:
+                        power = powers.get(pair)
+                        if power is None:
+                            power = powers[pair] = point[pair[0]] ** pair[1]
+                        coeff = coeff * power
+                    result += coeff
+                return result
+
+            if value(self.numer) * value(other.denom) != value(other.numer) * value(
+                self.denom
+            ):
+                return False
         return self.numer * other.denom == other.numer * self.denom
 
     def __hash__(self):
-        return hash(self.numer) * hash(self.denom)
+        r"""
+        Hash of a rational function.
+
+        Over exact domains, numerator and denominator are coprime (see :func:`simplify`), so two
+        equal rational functions only differ by a constant factor in both of them. The hashes of
+        :class:`SparsePolynomial` only depend on the monomials, so they do not change with that
+        factor. A rational function with constant denominator has the hash of its numerator,
+        as it is equal to a polynomial with the same monomials.
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> rf1 = RationalFunction.from_string("x/(x + y)", ['x','y'])
+            >>> rf2 = RationalFunction.from_string("(-2*x)/(-2*x - 2*y)", ['x','y'])
+            >>> rf1 == rf2 and hash(rf1) == hash(rf2)
+            True
+            >>> hash(rf1) == hash(RationalFunction.from_string("(x + y)/x", ['x','y']))
+            False
+            >>> sp = SparsePolynomial.from_string("x + y", ['x','y'])
+            >>> rf3 = RationalFunction.from_string("(2*x + 2*y)/2", ['x','y'])
+            >>> rf3 == sp and hash(rf3) == hash(sp)
+            True
+        """
+        if self.denom.is_constant():
+            return hash(self.numer)
+        return hash((hash(self.numer), hash(self.denom)))
 
     # --------------------------------------------------------------------------
     def exp(self, power):
-        """
-        Exponentiation, ``power`` is a *positive* integer
+        r"""
+        Exponentiation, ``power`` is a non-negative integer
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> rf = RationalFunction.from_string("(x + 1)/(2*y)", ['x','y'])
+            >>> rf.exp(3)
+            RationalFunction(1/8*x**3 + 3/8*x**2 + 3/8*x + 1/8, y**3)
+            >>> rf.exp(0)
+            RationalFunction(1, 1)
+            >>> rf.exp(1) is rf
+            True
         """
         if power < 0:
             raise ValueError(f"Cannot raise to power {power}, {str(self)}")
+        if power == 0:
+            return RationalFunction.from_const(1, self.gens, self.domain)
         if power == 1:
             return self
-        if power % 2 == 0:
-            return self.exp(power // 2) * self.exp(power // 2)
-        return self * self.exp(power // 2) * self.exp(power // 2)
+        ## `gcd(p, q) = 1` implies `gcd(p^n, q^n) = 1`: numerator and denominator are raised
+        ## separately (see :func:`SparsePolynomial.exp`) and nothing has to be simplified
+        rf = RationalFunction(
+            self.numer.exp(power), self.denom.exp(power), simplify=False
+        )
+        if self.domain.is_Exact and not rf.numer.is_zero():
+            rf._remove_denominator_content()
+        return rf
 
     # --------------------------------------------------------------------------
     @staticmethod
@@ -1725,105 +2756,169 @@ class RationalFunction:
         Parsing a string to a polynomial, string is allowed to include floating-point numbers
         in the standard and scientific notation, they will be converted to rationals
 
-        The code is an adapted version of fourFn example for pyparsing library by Paul McGuire
+        The string is converted into postfix notation (see :func:`_to_postfix`) and then
+        evaluated. The evaluation is an adapted version of fourFn example for pyparsing
+        library by Paul McGuire
         https://github.com/pyparsing/pyparsing/blob/master/examples/fourFn.py
-        """
 
-        def push_first(toks):
-            RationalFunction.__parser_stack.append(toks[0])
+        A string that is not a valid expression raises :class:`RationalFunctionParseError`
+        (nothing is printed), so the caller decides how to report it.
 
-        def push_unary_minus(toks):
-            for t in toks:
-                if t == "-":
-                    RationalFunction.__parser_stack.append("unary -")
-                else:
-                    break
-
-        # Creating a parser instance if necessary
-        if RationalFunction.__parser is None:
-            fnumber = Regex(r"[+-]?\d+(?:\.\d*)?(?:[eE][+-]?\d+)?")
-            ident = Regex(
-                f"(\\d[{alphanums+'_$'}]*[{alphas}]+[{alphanums+'_$'}]*)|([{alphas}]+[{alphanums+'_$'}]*)"
-            )  # Word(alphanums, alphanums + "_$") # ident = Word(alphas, alphanums + "_$")
-            plus, minus, mult, div = map(Literal, "+-*/")
-            lpar, rpar = map(Suppress, "()")
-            addop = plus | minus
-            multop = mult | div
-            expop = Literal("^") | Literal("**")
-
-            expr = Forward()
-            atom = (
-                addop[...]
-                + (
-                    (fnumber | ident).setParseAction(
-                        push_first
-                    )  # (ident | fnumber).setParseAction(push_first)
-                    | Group(lpar + expr + rpar)
-                )
-            ).setParseAction(push_unary_minus)
+        The output is always a new object that can be modified safely.
 
-            factor = Forward()
-            factor <<= atom + (expop + factor).setParseAction(push_first)[...]
-            term = factor + (multop + factor).setParseAction(push_first)[...]
-            expr <<= term + (addop + term).setParseAction(push_first)[...]
-            RationalFunction.__parser = expr
-
-        # parsing
-        try:
-            RationalFunction.__parser.parseString(s, parseAll=True)
-        except:
-            print(s)
-            raise
+        Examples::
 
-        # for fast lookup
-        var_ind_map = (
-            {v: i for i, v in enumerate(varnames)} if var_to_ind is None else var_to_ind
-        )
+            >>> from clue.rational_function import *
+            >>> rf = RationalFunction.from_string("(0)", ['x','y'])
+            >>> rf.numer += SparsePolynomial.from_string("x", ['x','y'])
+            >>> RationalFunction.from_string("(0)", ['x','y'])
+            RationalFunction(0, 1)
+            >>> RationalFunction.from_string("y*(0) + 1", ['x','y'])
+            RationalFunction(1, 1)
+        """
 
-        def evaluate_stack(s):
-            op = s.pop()
-            if op == "unary -":
-                return -evaluate_stack(s)
-            if op in "+-*/":
-                # note: operands are pushed onto the stack in reverse order
-                op2 = evaluate_stack(s)
-                op1 = evaluate_stack(s)
-                if op == "+":
-                    if op1.size < op2.size:
-                        op1, op2 = op2, op1
-                    op1 += op2
-                    return op1
-                if op == "-":
-                    op1 -= op2
-                    return op1
-                if op == "*":
-                    return op1 * op2
-                if op == "/":
-                    return op1 / op2
-            if op == "^" or op == "**":
-                exp_str = s.pop()
-                exp = to_rational(exp_str)
-                if exp.denominator != 1:
-                    raise ValueError(
-                        "invalid literal for int() with base 10: %s" % exp_str
-                    )
-                exp = int(exp)
-                base = evaluate_stack(s)
-                return base.exp(exp)
-            if re.match(r"^[+-]?\d+(?:\.\d*)?(?:[eE][+-]?\d+)?$", op):
-                return RationalFunction.from_const(to_rational(op), varnames, domain)
+        # for fast lookup (the map and the leaves only depend on the variables and the domain)
+        gens = tuple(varnames)
+        context = _parsing_context(gens, domain)
+        var_ind_map = context.var_to_ind if var_to_ind is None else var_to_ind
+        variables = context.variables
+
+        # simple cases: a number or a power of a variable
+        leaf = _NUMBER.fullmatch(s)
+        if leaf is not None:
+            return RationalFunction.from_const(_to_rational(leaf[1]), varnames, domain)
+        leaf = _VARIABLE_POWER.fullmatch(s)
+        if leaf is not None and leaf[1] in var_ind_map:
+            i = var_ind_map[leaf[1]]
+            exp = int(leaf[2] or 1)
             return RationalFunction(
                 SparsePolynomial(
-                    varnames, domain, {((var_ind_map[op], 1),): domain.one}
+                    varnames, domain, {((i, exp),) if exp else (): domain.one}
                 ),
                 SparsePolynomial.from_const(1, varnames, domain),
             )
 
-        return evaluate_stack(RationalFunction.__parser_stack)
+        # parsing
+        stack = _to_postfix(s)
+
+        def value(operand):
+            r"""Rational function of an operand in ``operands`` (see the loop below)"""
+            if type(operand) is RationalFunction:
+                return operand
+            if type(operand) is tuple:  # a number
+                return _parsed_number(operand[0], gens, domain)
+            if type(operand) is str:  # a variable
+                return variables[var_ind_map[operand]]
+            ## a chain of sums `a + b - c ...`: the polynomials are accumulated in place in a
+            ## new polynomial, so each term is only read once (instead of copying the partial
+            ## sum at each step)
+            poly = one = rational = None
+            for op, term in operand:
+                term = value(term)
+                if term.denom.is_unitary():
+                    if poly is not None:
+                        if op == "+":
+                            poly += term.numer
+                        else:
+                            poly -= term.numer
+                    else:
+                        one = term.denom
+                        poly = (
+                            SparsePolynomial(varnames, domain, term.numer._data, cast=False)
+                            if op == "+"
+                            else -term.numer
+                        )
+                elif rational is None:
+                    rational = term if op == "+" else -term
+                elif op == "+":
+                    rational = rational + term
+                else:
+                    rational = rational - term
+            if poly is None:
+                return rational
+            if rational is None:
+                return RationalFunction(poly, one)
+            return rational + poly
+
+        ## evaluation of the postfix tokens: numbers and variables are kept as tokens until they
+        ## are needed (so exponents can be read) and sums are kept as lists of terms until the
+        ## chain of sums ends
+        operands = []
+        push, pop = operands.append, operands.pop
+        for token in stack:
+            if type(token) is tuple or token not in _PRECEDENCE:
+                push(token)
+            elif token == "unary -":
+                push(-value(pop()))
+            elif token == "+" or token == "-":
+                right, left = pop(), pop()
+                if type(left) is list:
+                    left.append((token, right))
+                    push(left)
+                else:
+                    push([("+", left), (token, right)])
+            elif token == "*":
+                right = value(pop())
+                push(value(pop()) * right)
+            elif token == "/":
+                right = value(pop())
+                push(value(pop()) / right)
+            else:  # a power: only a number can be an exponent
+                exp_str = pop()
+                if type(exp_str) is not tuple:
+                    raise ValueError(
+                        f"Only integer numbers can be exponents, got {value(exp_str)}"
+                    )
+                exp = _to_rational(exp_str[0])
+                if exp.denominator != 1:
+                    raise ValueError(
+                        "invalid literal for int() with base 10: %s" % exp_str[0]
+                    )
+                push(value(pop()).exp(int(exp)))
+
+        result = value(pop())
+        ## the leaves are shared (see :func:`_parsing_context`): only the denominator `1` and
+        ## a monomial or the zero in the numerator may come from them
+        if result.denom.is_unitary():
+            numer = result.numer
+            if numer.size <= 1:
+                numer = SparsePolynomial(varnames, domain, numer._data, cast=False)
+            result = RationalFunction(
+                numer, SparsePolynomial.from_const(1, varnames, domain), simplify=False
+            )
+        return result
 
     @staticmethod
     def from_sympy(sympy_expr, varnames, domain=QQ):
+        r"""
+        Rational function given by a SymPy expression in the variables ``varnames``.
+
+        Numerator and denominator are converted directly with the SymPy polynomial ring of
+        ``varnames`` (see :func:`SparsePolynomial.get_sympy_ring`). Expressions with
+        floating-point numbers (or not accepted by the ring) are printed and parsed with
+        :func:`SparsePolynomial.from_string`, so the numbers are read exactly as they are written.
+
+        Examples::
+
+            >>> from clue.rational_function import *
+            >>> from sympy import parse_expr
+            >>> RationalFunction.from_sympy(parse_expr("(x**2 - y**2)/(2*x + 2*y)"), ['x','y'])
+            RationalFunction(1/2*x - 1/2*y, 1)
+            >>> RationalFunction.from_sympy(parse_expr("0.1*x/y"), ['x','y'])
+            RationalFunction(1/10*x, y)
+        """
         num, den = sympy_expr.as_expr().as_numer_denom()
+        if not (num.has(sympy.Float) or den.has(sympy.Float)):
+            ring = _sympy_ring(tuple(varnames), domain)
+            try:
+                num, den = ring.from_expr(num), ring.from_expr(den)
+            except (ValueError, sympy.polys.polyerrors.CoercionFailed):
+                pass
+            else:
+                return RationalFunction(
+                    SparsePolynomial.from_sympy(num, varnames),
+                    SparsePolynomial.from_sympy(den, varnames),
+                )
         num = SparsePolynomial.from_string(str(num), varnames, domain)
         den = SparsePolynomial.from_string(str(den), varnames, domain)
         return RationalFunction(num, den)
@@ -1831,4 +2926,81 @@ class RationalFunction:
 
 # ------------------------------------------------------------------------------
 
-__all__ = ["SparsePolynomial", "RationalFunction"]
+
+@lru_cache(maxsize=4096)
+def _parse_polynomial(s, varnames, domain):
+    r"""Cached parsing of polynomials used by :func:`SparsePolynomial.from_string` (must not be modified)"""
+    return RationalFunction.from_string(s, list(varnames), domain).get_poly()
+
+
+_ParsingContext = namedtuple("_ParsingContext", ["var_to_ind", "variables", "one"])
+
+
+@lru_cache(maxsize=32)
+def _parsing_context(varnames, domain):
+    r"""
+    Data of :func:`RationalFunction.from_string` that only depends on ``varnames`` and ``domain``.
+
+    A :class:`RationalFunction` is parsed many times with the same variables (e.g., all the
+    equations of a system), so the index of each name (``var_to_ind``), the rational functions
+    of the variables (``variables``) and the polynomial `1` (``one``) are built only once. All
+    the leaves share ``one`` as denominator, so their sums and products find equal denominators
+    by identity. None of these objects may be modified.
+
+    Examples::
+
+        >>> from clue.rational_function import _parsing_context
+        >>> context = _parsing_context(("x", "y"), QQ)
+        >>> context.var_to_ind, context.variables
+        ({'x': 0, 'y': 1}, (RationalFunction(x, 1), RationalFunction(y, 1)))
+        >>> context.variables[1].denom is context.one
+        True
+    """
+    one = SparsePolynomial.from_const(1, list(varnames), domain)
+    varnames = one._varnames
+    return _ParsingContext(
+        {name: i for i, name in enumerate(varnames)},
+        tuple(
+            RationalFunction(SparsePolynomial(varnames, domain, {((i, 1),): domain.one}), one)
+            for i in range(len(varnames))
+        ),
+        one,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parsed_number(token, varnames, domain):
+    r"""Rational function of the number written in ``token`` (see :func:`_parsing_context`, must not be modified)"""
+    context = _parsing_context(varnames, domain)
+    return RationalFunction(
+        SparsePolynomial.from_const(to_rational(token), context.one._varnames, domain),
+        context.one,
+    )
+
+
+@lru_cache(maxsize=256)
+def _random_point(size):
+    r"""
+    Fixed pseudo-random point with ``size`` integer coordinates, used by :func:`RationalFunction.__eq__`.
+
+    Examples::
+
+        >>> from clue.rational_function import _random_point
+        >>> _random_point(3) == _random_point(3)
+        True
+        >>> len(_random_point(5))
+        5
+    """
+    generator = random.Random(size)
+    return tuple(generator.randint(2, 2**15) for _ in range(size))
+
+
+@lru_cache(maxsize=256)
+def _sympy_ring(varnames, domain):
+    r"""Cached SymPy polynomial ring used by :func:`SparsePolynomial.get_sympy_ring`"""
+    return sympy.polys.rings.ring(varnames, domain)[0]
+
+
+# ------------------------------------------------------------------------------
+
+__all__ = ["SparsePolynomial", "RationalFunction", "RationalFunctionParseError"]
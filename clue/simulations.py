@@ -3,7 +3,6 @@ r"""
 """
 
 from math import ceil
-from matplotlib.pyplot import subplots
 from numpy import array, concatenate, diff, inf, matmul, ndarray, nditer
 from numpy.linalg import norm
 from scipy.integrate._ivp.ivp import OdeResult
@@ -239,6 +238,8 @@ def create_figure(
     ###########################################################################################
     ### CREATING THE FIGURE
     ###########################################################################################
+    from matplotlib.pyplot import subplots  # pyplot is slow to import
+
     fig, ax = subplots(nrows, ncols, figsize=figsize, **kwds)
     for i, a in enumerate(
         nditer(ax, ("refs_ok",))
@@ -1,17 +1,23 @@
 from clue import *
+import numpy as np
 from sympy import QQ
 from scipy import sparse
 
+def to_coo_arrays(M):
+    rows, columns, values = M.to_coo()
+    indices = np.empty((len(values), 2), dtype=np.int64)
+    indices[:, 0], indices[:, 1] = rows, columns
+    values = np.fromiter((v.numerator / v.denominator for v in values), dtype=np.float64, count=len(values))
+    return indices, values, (M.nrows, M.ncols)
+
 def to_sptf(M):
     import tensorflow as tf
-    indices, values = M.to_coo()
-    values = [float(v) for v in values]
-    return tf.sparse.SparseTensor(indices, values, [M.nrows, M.ncols])
+    indices, values, shape = to_coo_arrays(M)
+    return tf.sparse.SparseTensor(indices, values, list(shape))
 
 def to_scipy_sparse(M):
-    rows, columns, values = M.to_coo()
-    values = [float(v) for v in values]
-    return sparse.coo_matrix((values, (rows, columns)), shape=(M.nrows, M.ncols))
+    indices, values, shape = to_coo_arrays(M)
+    return sparse.coo_matrix((values, (indices[:, 0], indices[:, 1])), shape=shape)
 
 
 M = SparseRowMatrix.from_list([[1,0],[0,1]], QQ)